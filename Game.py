@@ -1,18 +1,21 @@
+import time
 import pygame as pg
-from typing import List, Optional, Dict
+from collections import deque
+from typing import Deque, Optional, Dict
 
-from engine.Update import update_input
-from input.Event import poll_events
+from engine.Update import update_input, update_physics
+from input.Event import poll_events, filter_events
 from rendering import SpriteManager
 from entity.Camera import Camera
 from world.Chunk import Chunk, calculate_player_position
 from rendering.Drawer import Drawer
 from rendering.CraftingMenu import CraftingMenu
-from input.Keyboard import Keyboard
+from input.Keyboard import Keyboard, KEY_E, LEFT_KEYS, RIGHT_KEYS
 from input.Mouse import Mouse
 from entity.Player import Player
 from entity.Gravity import Gravity
 from world.World import load_chunks
+from world.ChunkCache import ChunkCache
 from world.Inventory import Inventory
 from world.BlockInteraction import BlockInteraction
 from world import CraftingRecipes
@@ -28,13 +31,20 @@ class Game:
     game state, handling input, and rendering the game world.
 
     Attributes:
-        dt (float): Delta time between frames in seconds.
+        dt (float): Delta time between frames in seconds, clamped to MAX_FRAME_TIME.
+        TARGET_FPS (int): The frame rate the game loop is capped at.
+        MENU_FPS (int): The frame rate the game loop is capped at while the crafting menu is idle.
+        MAX_FRAME_TIME (float): The largest delta time physics is advanced by in one frame.
+        last_frame_ns (int): Performance counter timestamp of the previous frame in nanoseconds.
+        PHYSICS_TIMESTEP (float): The fixed time step physics is advanced by in seconds.
+        physics_accumulator (float): Frame time not yet consumed by physics steps in seconds.
         camera (Camera): The camera that determines the view position.
         drawer (Drawer): The renderer for drawing the game world.
         keyboard (Keyboard): The keyboard input handler.
-        chunk_list (List[Chunk]): List of chunks that make up the game world.
+        chunk_list (Deque[Chunk]): The loaded chunks that make up the game world, ordered left to right.
+        chunk_cache (ChunkCache): Recently unloaded chunks kept for reuse.
         player (Player): The player entity controlled by the user.
-        clock (pg.time.Clock): The game clock for timing and FPS calculation.
+        clock (pg.time.Clock): The game clock for frame rate capping and FPS calculation.
         gravity (Gravity): The gravity physics component for the player.
         fps (int): Current frames per second.
     """
@@ -46,6 +56,16 @@ class Game:
         self.water_update_timer = 0
         self.WATER_UPDATE_INTERVAL = 1 / 10
 
+        # Frame pacing
+        self.TARGET_FPS = 120
+        self.MENU_FPS = 30  # The open crafting menu only redraws this often unless there is input
+        self.MAX_FRAME_TIME = 1 / 30  # Longer frames (e.g. after a stall) are clamped
+        self.last_frame_ns = time.perf_counter_ns()
+
+        # Physics runs in fixed steps, independent of the frame rate
+        self.PHYSICS_TIMESTEP = 1 / 120
+        self.physics_accumulator = 0.0
+
         # Init a camera object
         self.camera = Camera()
 
@@ -57,7 +77,8 @@ class Game:
         self.mouse = Mouse()
 
         # Create our chunks
-        self.chunk_list: List[Chunk] = [Chunk(-1), Chunk(0), Chunk(1)]
+        self.chunk_list: Deque[Chunk] = deque([Chunk(-1), Chunk(0), Chunk(1)])
+        self.chunk_cache = ChunkCache()
 
         # Create our player object
         self.player = Player()
@@ -75,6 +96,9 @@ class Game:
         self.crafting_menu = CraftingMenu(self.drawer.SCREEN_WIDTH, self.drawer.SCREEN_HEIGHT)
         self.crafting_menu_open = False
 
+        # Only queue the events the game handles
+        filter_events(self.crafting_menu_open)
+
         # Initialize sound system
         self.sounds = Sounds()
         self.sounds.play_ambient()  # Start playing ambient sound
@@ -97,14 +121,19 @@ class Game:
 
         # No need to handle crafting menu events here, they will be handled in main_loop
 
-        # Update player position based on physics and input
-        self.player.update_player_position(self.chunk_list)
+        # The player, camera and loaded chunks stay put while the crafting menu is open
+        if not self.crafting_menu_open:
+            # Advance physics in fixed steps covering this frame's time
+            self.physics_accumulator += self.dt
+            while self.physics_accumulator >= self.PHYSICS_TIMESTEP:
+                update_physics(self.PHYSICS_TIMESTEP, self.player, self.gravity, self.chunk_list)
+                self.physics_accumulator -= self.PHYSICS_TIMESTEP
 
-        # Center the camera on the player
-        self.camera.center_on_player(self.player)
+            # Center the camera on the player
+            self.camera.center_on_player(self.player)
 
-        # Load or unload chunks as needed based on player position
-        load_chunks(self.chunk_list, self.player)
+            # Load or unload chunks as needed based on player position
+            load_chunks(self.chunk_list, self.player, self.chunk_cache)
 
         # Update water blocks
         self.water_update_timer += self.dt
@@ -132,18 +161,15 @@ class Game:
         """
         Process input and update player movement and physics.
 
-        This method calculates delta time for the current frame and
-        delegates input handling to the update_input function.
+        This method delegates input handling to the update_input function.
         """
-        # Calculate delta time for this frame
-        self.dt = self.clock.tick() / 1000  # Convert milliseconds to seconds
-
         # Update keyboard state
         self.keyboard.update()
 
         # Toggle crafting menu when E is pressed
-        if self.keyboard.e_pressed:
+        if self.keyboard.key_just_pressed(KEY_E):
             self.crafting_menu_open = not self.crafting_menu_open
+            filter_events(self.crafting_menu_open)
             # Update crafting menu when opened
             if self.crafting_menu_open:
                 self.crafting_menu.update(self.inventory)
@@ -151,38 +177,23 @@ class Game:
         # Only process movement and inventory selection if crafting menu is closed
         if not self.crafting_menu_open:
             # Use the update_input function to handle player movement
-            update_input(self.dt, self.keyboard, self.player, self.gravity)
-
-            # Handle inventory selection with number keys
-            if self.keyboard.key_1:
-                self.inventory.select_block(0)
-            elif self.keyboard.key_2:
-                self.inventory.select_block(1)
-            elif self.keyboard.key_3:
-                self.inventory.select_block(2)
-            elif self.keyboard.key_4:
-                self.inventory.select_block(3)
-            elif self.keyboard.key_5:
-                self.inventory.select_block(4)
-            elif self.keyboard.key_6:
-                self.inventory.select_block(5)
-            elif self.keyboard.key_7:
-                self.inventory.select_block(6)
-            elif self.keyboard.key_8:
-                self.inventory.select_block(7)
-            elif self.keyboard.key_9:
-                self.inventory.select_block(8)
+            update_input(self.keyboard, self.player, self.gravity)
+
+            # Handle inventory selection with number keys, lowest pressed key wins
+            number_keys = self.keyboard.number_keys_mask
+            if number_keys:
+                self.inventory.select_block((number_keys & -number_keys).bit_length() - 1)
 
             # Update player direction
-            if self.keyboard.a or self.keyboard.left:
+            keys = self.keyboard.state
+            if keys & LEFT_KEYS:
                 self.player.facingLeft = True
 
-            if self.keyboard.d or self.keyboard.right:
+            if keys & RIGHT_KEYS:
                 self.player.facingLeft = False
 
             # Play running sounds if player is moving
-            is_moving = (self.keyboard.a or self.keyboard.left or 
-                         self.keyboard.d or self.keyboard.right)
+            is_moving = keys & (LEFT_KEYS | RIGHT_KEYS)
 
             if is_moving and self.player.grounded:
                 # Get the surface type the player is standing on
@@ -249,40 +260,39 @@ class Game:
         This method handles the game's main loop, updating the game state
         and processing events each frame.
         """
-        while True:
-            # Test scrolling manually
-
-            # Reset mouse click events at the beginning of each frame
-            if self.mouse:
-                self.mouse.reset_click_events()
-
-            # Update mouse position
-            if self.mouse:
-                self.mouse.x, self.mouse.y = pg.mouse.get_pos()
-
-            # Process all events
-            for event in pg.event.get():
-                # Handle window close event
-                if event.type == pg.QUIT:
-                    pg.quit()
-                    quit()
+        try:
+            while True:
+                # Cap the frame rate so the loop sleeps instead of spinning the CPU; the clock
+                # is otherwise only used for the FPS counter. Sleeping before polling input,
+                # rather than after rendering, keeps input from aging during the sleep
+                self.clock.tick(self.TARGET_FPS)
+
+                # While the crafting menu is open, sleep until input arrives or the next
+                # menu frame is due instead of redrawing the static menu at full rate
+                timeout_ms = 0
+                if self.crafting_menu_open:
+                    elapsed_ms = (time.perf_counter_ns() - self.last_frame_ns) // 1_000_000
+                    timeout_ms = 1000 // self.MENU_FPS - elapsed_ms
 
-                # Handle keyboard events
-                if event.type == pg.KEYDOWN or event.type == pg.KEYUP:
-                    self.keyboard.handle_events(event)
+                # Process all events
+                events = poll_events(self.keyboard, self.mouse, timeout_ms)
 
-                # Handle mouse events
-                if event.type == pg.MOUSEBUTTONDOWN or event.type == pg.MOUSEBUTTONUP:
-                    self.mouse.handle_events(event)
+                # Calculate delta time for this frame from the integer nanosecond counter,
+                # clamped so a long stall doesn't advance physics by a huge step
+                now = time.perf_counter_ns()
+                self.dt = min((now - self.last_frame_ns) * 1e-9, self.MAX_FRAME_TIME)
+                self.last_frame_ns = now
 
                 # Handle crafting menu events when the menu is open
                 if self.crafting_menu_open:
-                    recipe = self.crafting_menu.handle_event(event)
-                    if recipe:
-                        # Craft the item
-                        if CraftingRecipes.craft_item(recipe, self.inventory):
-                            # Update the crafting menu after crafting
-                            self.crafting_menu.update(self.inventory)
-
-            # Update the game
-            self.update()
+                    for event in events:
+                        recipe = self.crafting_menu.handle_event(event)
+                        if recipe:
+                            # Craft the item; the menu picks up the inventory change when drawn
+                            CraftingRecipes.craft_item(recipe, self.inventory)
+
+                # Update the game
+                self.update()
+        finally:
+            # Stop the chunk generation worker when the game exits
+            self.chunk_cache.close()
@@ -1,20 +1,22 @@
 from operator import truediv
-from typing import Optional
+from typing import Optional, Sequence
 import pygame as pg
 
+from input.Keyboard import JUMP_KEYS, LEFT_KEYS, RIGHT_KEYS
+
 # Movement constants
 MOVEMENT_SPEED = 600  # Player movement speed in pixels per second
 WATER_MOVEMENT_SPEED = 300  # Player movement speed in water (pixels per second)
 
-def update_input(dt: float, keyboard: 'Keyboard', player: 'Player', gravity: 'Gravity') -> None:
+def update_input(keyboard: 'Keyboard', player: 'Player', gravity: 'Gravity') -> None:
     """
-    Process input and update player movement and physics.
+    Process input and set the player's movement for this frame.
 
-    This function handles keyboard input for player movement and applies
-    gravity physics. It should be called once per frame.
+    This function handles keyboard input for player movement. It should be
+    called once per frame and only sets velocities; positions are advanced
+    by update_physics.
 
     Args:
-        dt: Delta time in seconds since the last frame.
         keyboard: The keyboard input handler.
         player: The player entity to update.
         gravity: The gravity physics component for the player.
@@ -24,12 +26,36 @@ def update_input(dt: float, keyboard: 'Keyboard', player: 'Player', gravity: 'Gr
 
     # Process player movement based on keyboard input
     # Only allow jumping when the player is on the ground
-    if (keyboard.up or keyboard.w or keyboard.space) and player.grounded is True:
-        gravity.jump(dt)
-    if keyboard.left or keyboard.a:
-        player.x_change -= current_speed * dt
-    if keyboard.right or keyboard.d:
-        player.x_change += current_speed * dt
+    keys = keyboard.state
+    if keys & JUMP_KEYS and player.grounded is True:
+        gravity.jump()
+
+    player.x_velocity = 0.0
+    if keys & LEFT_KEYS:
+        player.x_velocity -= current_speed
+    if keys & RIGHT_KEYS:
+        player.x_velocity += current_speed
+
+
+def update_physics(dt: float, player: 'Player', gravity: 'Gravity', chunk_list: Sequence['Chunk']) -> None:
+    """
+    Advance the player's physics by one fixed time step.
+
+    This function moves the player by its horizontal velocity, applies gravity
+    physics and resolves collisions with the world. It is called a whole number
+    of times per frame with a constant dt, so movement and jump heights don't
+    depend on the frame rate.
+
+    Args:
+        dt: The fixed time step in seconds.
+        player: The player entity to update.
+        gravity: The gravity physics component for the player.
+        chunk_list: The loaded chunks to check for collisions.
+    """
+    player.x_change += player.x_velocity * dt
 
     # Apply gravity physics
     gravity.apply_gravity(dt)
+
+    # Update player position based on physics and collisions
+    player.update_player_position(chunk_list)
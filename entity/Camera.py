@@ -1,3 +1,4 @@
+import math
 from typing import Any
 
 from world import Block
@@ -12,39 +13,38 @@ class Camera:
     TILE_SIZE: int = 64
     VIEW_TILES_WIDTH: float = 1280 / Block.BLOCK_SIZE
     VIEW_TILES_HEIGHT: float = 720 / Block.BLOCK_SIZE
-    DEFAULT_VIEW_WIDTH: int = TILE_SIZE * VIEW_TILES_WIDTH
-    DEFAULT_VIEW_HEIGHT: int = TILE_SIZE * VIEW_TILES_HEIGHT
+    DEFAULT_VIEW_WIDTH: int = int(TILE_SIZE * VIEW_TILES_WIDTH)
+    DEFAULT_VIEW_HEIGHT: int = int(TILE_SIZE * VIEW_TILES_HEIGHT)
 
     def __init__(self) -> None:
-        self.x: float = 0
-        self.y: float = 0
+        # Camera position is kept in whole pixels so everything drawn relative to it lines up
+        self.x: int = 0
+        self.y: int = 0
         self.view_width: int = self.DEFAULT_VIEW_WIDTH
         self.view_height: int = self.DEFAULT_VIEW_HEIGHT
-
-    def _calculate_bound(self, position: float, size: float) -> float:
-        """Helper method to calculate boundary position."""
-        return position + (size / 2)
+        self.half_width: int = self.view_width // 2
+        self.half_height: int = self.view_height // 2
 
     @property
-    def left_bound(self) -> float:
-        return self._calculate_bound(self.x, -self.view_width)
+    def left_bound(self) -> int:
+        return self.x - self.half_width
 
     @property
-    def right_bound(self) -> float:
-        return self._calculate_bound(self.x, self.view_width)
+    def right_bound(self) -> int:
+        return self.x + self.half_width
 
     @property
-    def top_bound(self) -> float:
-        return self._calculate_bound(self.y, -self.view_height)
+    def top_bound(self) -> int:
+        return self.y - self.half_height
 
     @property
-    def bottom_bound(self) -> float:
-        return self._calculate_bound(self.y, self.view_height)
+    def bottom_bound(self) -> int:
+        return self.y + self.half_height
 
     def set_center_position(self, x: float, y: float) -> None:
-        """Sets camera position relative to the top-left boundary."""
-        self.x = x - self.view_width / 2
-        self.y = y - self.view_height / 2
+        """Sets camera position relative to the top-left boundary, rounded down to whole pixels."""
+        self.x = math.floor(x) - self.half_width
+        self.y = math.floor(y) - self.half_height
 
     def center_on_player(self, player: Any) -> None:
         """
@@ -21,6 +21,8 @@ class Entity:
         rect (pygame.Rect): The rectangle representing the entity's position and size.
     """
 
+    __slots__ = ('x', 'y', 'width', 'height', 'type', 'image', 'rect')
+
     def __init__(self, x: float, y: float, width: int, height: int, type: str) -> None:
         """
         Initialize a new Entity.
@@ -20,6 +20,8 @@ class Gravity:
         can_jump (bool): Whether the entity can jump.
     """
 
+    __slots__ = ('player', 'game', 'vertical_velocity', 'is_grounded', 'can_jump')
+
     # Physics constants
     GRAVITY_ACCELERATION = 980.0  # pixels/second²
     TERMINAL_VELOCITY = 1000.0    # pixels/second
@@ -46,34 +48,35 @@ class Gravity:
 
         This method updates the entity's vertical velocity and position
         based on gravity acceleration and the time elapsed since the last frame.
+        It uses semi-implicit Euler integration: the velocity is updated first
+        and the new velocity moves the entity.
 
         Args:
-            dt: Delta time in seconds since the last frame.
+            dt: Delta time in seconds since the last frame. Game passes its fixed
+                physics time step, so dt is always small and constant.
         """
         if not self.is_grounded:
             # Apply gravity acceleration
-            self.vertical_velocity += self.GRAVITY_ACCELERATION * dt
+            vertical_velocity = self.vertical_velocity + self.GRAVITY_ACCELERATION * dt
 
             # Limit to terminal velocity
-            self.vertical_velocity = min(self.vertical_velocity, self.TERMINAL_VELOCITY)
+            if vertical_velocity > self.TERMINAL_VELOCITY:
+                vertical_velocity = self.TERMINAL_VELOCITY
+            self.vertical_velocity = vertical_velocity
 
             # Update entity position
-            self.player.y_change += self.vertical_velocity * dt
+            self.player.y_change += vertical_velocity * dt
         else:
             # Apply jump velocity
             self.vertical_velocity = self.JUMP_VELOCITY
             self.is_grounded = False
 
-    def jump(self, dt: float) -> None:
+    def jump(self) -> None:
         """
         Make the entity jump.
 
-        This method sets the entity's state to jumping and applies
-        the initial jump velocity.
-
-        Args:
-            dt: Delta time in seconds since the last frame.
+        This method sets the entity's state to jumping. The initial jump
+        velocity is applied by the next apply_gravity step.
         """
         self.is_grounded = True
         self.can_jump = True
-        self.apply_gravity(dt)
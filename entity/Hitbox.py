@@ -4,10 +4,8 @@ Hitbox module for collision detection and physics.
 This module provides the Hitbox class for handling collision detection
 and physics interactions between entities and the game world.
 """
-import math
 from typing import List, Any, Optional, Tuple
 
-from world.Block import Block
 from world.Block import BLOCK_SIZE, AIR, OAK_LOG, LEAVES, POPPY, WATER, GRASS, DIRT, STONE, COAL, IRON, GOLD, DIAMOND, COBBLE_STONE
 from world.Chunk import CHUNK_WIDTH, CHUNK_HEIGHT, calculate_player_position
 from entity.Entity import Entity
@@ -15,6 +13,12 @@ from entity.Entity import Entity
 # Physics constants
 GRAVITY = 9.8  # m/s^2, adjust as needed for your game's scale
 
+# Width of a chunk in pixels
+CHUNK_PIXEL_WIDTH = CHUNK_WIDTH * BLOCK_SIZE
+
+# Block types the entity can pass through
+NON_SOLID_BLOCKS = frozenset((AIR, OAK_LOG, LEAVES, POPPY, WATER))
+
 
 class Hitbox(Entity):
     """
@@ -27,12 +31,18 @@ class Hitbox(Entity):
         chunk_x (int): The x-coordinate within the current chunk.
         chunk_y (int): The y-coordinate within the current chunk.
         x_change (float): The target x-coordinate for movement.
+        x_velocity (float): The horizontal velocity in pixels/second.
         y_change (float): The target y-coordinate for movement.
         mass (float): The mass of the entity for physics calculations.
         friction_coefficient (float): The friction coefficient for physics calculations.
         grounded (bool): Whether the entity is on the ground.
+        in_water (bool): Whether the entity is in water.
     """
 
+    # Physics state is read many times per step, so keep it in slots
+    __slots__ = ('chunk_x', 'chunk_y', 'x_change', 'y_change', 'x_velocity', 'mass',
+                 'friction_coefficient', 'grounded', 'in_water')
+
     def __init__(self, x: float, y: float, width: int, height: int, type: str, 
                  mass: float = 1.0, friction_coefficient: float = 0.5) -> None:
         """
@@ -52,6 +62,7 @@ class Hitbox(Entity):
         self.chunk_y: Optional[int] = None
         self.x_change = x  # Initialize to current position
         self.y_change = y  # Initialize to current position
+        self.x_velocity = 0.0
         self.mass = mass
         self.friction_coefficient = friction_coefficient
         self.grounded = True
@@ -69,30 +80,18 @@ class Hitbox(Entity):
         """
         # Calculate chunk coordinates
         absolute_x = self.x
-        self.chunk_x = math.floor((absolute_x % (CHUNK_WIDTH * BLOCK_SIZE)) / BLOCK_SIZE)
-        self.chunk_y = math.floor(self.y / BLOCK_SIZE)
-
-        # Get the current chunk number
-        chunk_number = calculate_player_position(self)
+        self.chunk_x = int(absolute_x % CHUNK_PIXEL_WIDTH // BLOCK_SIZE)
+        self.chunk_y = int(self.y // BLOCK_SIZE)
 
         # Determine which chunks to check based on position
         chunks_to_check = self._get_chunks_to_check(chunk_list)
 
-        # Find colliding blocks
-        block_list = self._find_colliding_blocks(chunks_to_check)
-
-        # Check if player is in water
-        self.in_water = self._check_if_in_water(chunks_to_check)
+        # Find colliding blocks and check if player is in water
+        block_list, self.in_water = self._scan_neighborhood(chunks_to_check)
 
-        # Resolve collisions
+        # Resolve collisions, which also decides whether the entity is grounded
         self._resolve_collisions(block_list)
 
-        for block in block_list:
-            if block.y >= self.y:
-                self.grounded = True
-            else:
-                self.grounded = False
-
         # Update position
         self.x = self.x_change
         self.y = self.y_change
@@ -105,167 +104,132 @@ class Hitbox(Entity):
             chunk_list: The list of chunks.
 
         Returns:
-            A tuple containing the left, center, and right chunks to check.
+            A tuple containing the left, center, and right chunks to check. The
+            center chunk is the one the entity is in; a neighbor that isn't
+            loaded is None.
         """
-        # Calculate if we are on the left or right edge of a chunk
-        on_left_edge = self.chunk_x % CHUNK_WIDTH == 0
-        on_right_edge = self.chunk_x % CHUNK_WIDTH == CHUNK_WIDTH - 1
-
-        # Default to center chunk for all positions
-        left_chunk = center_chunk = right_chunk = chunk_list[1]
-
-        # Adjust chunks if on edges
-        if on_left_edge:
-            left_chunk = chunk_list[0]
-
-        if on_right_edge:
-            right_chunk = chunk_list[2]
-
-        return left_chunk, center_chunk, right_chunk
+        # The entity is normally in the middle chunk, but it can cross into a neighbor
+        # during physics before load_chunks recenters the list
+        loaded = (None, *chunk_list, None)
+        center = min(max(calculate_player_position(self) - chunk_list[0].position, 0), len(chunk_list) - 1) + 1
+        return loaded[center - 1], loaded[center], loaded[center + 1]
 
-    def _find_colliding_blocks(self, chunks: Tuple[Any, Any, Any]) -> List[Any]:
+    def _scan_neighborhood(self, chunks: Tuple[Any, Any, Any]) -> Tuple[List[Tuple[int, int]], bool]:
         """
-        Find blocks that the entity is colliding with.
+        Find the blocks the entity is colliding with and check if it is in water.
+
+        Both checks read the block types around the entity, so they are done in
+        one pass over the chunks.
 
         Args:
             chunks: A tuple containing the left, center, and right chunks to check.
 
         Returns:
-            A list of blocks that the entity is colliding with.
+            A tuple of the list of (x, y) world positions of the blocks that the
+            entity is colliding with, and whether the entity is in water.
         """
-        left_chunk, center_chunk, right_chunk = chunks
-        block_list = []
-
-        # Check blocks in a 5x6 area around the player (optimized search area)
-        for dy in range(-2, 4):
-            for dx in range(-2, 3):
-                check_x = self.chunk_x + dx
-                check_y = self.chunk_y + dy
-
-                # Determine which chunk to check based on position
-                current_chunk = center_chunk
-                if check_x < 0:
-                    if left_chunk:
-                        check_x = CHUNK_WIDTH + check_x
-                        current_chunk = left_chunk
-                elif check_x >= CHUNK_WIDTH:
-                    if right_chunk:
-                        check_x = check_x - CHUNK_WIDTH
-                        current_chunk = right_chunk
-                    else:
-                        continue
-
-                # Skip if out of bounds
-                if not (0 <= check_x < CHUNK_WIDTH and 0 <= check_y < CHUNK_HEIGHT):
-                    continue
-
-                # Get the block and check if it's solid
-                block = current_chunk.blocks[check_y][check_x]
-                if block is None or block.block_type in (AIR, OAK_LOG, LEAVES, POPPY, WATER):
-                    continue
-
-                # Adjust block's absolute position based on chunk
-                block.x = (current_chunk.position * CHUNK_WIDTH * BLOCK_SIZE) + (check_x * BLOCK_SIZE)
-
-                # Check for collision
-                if self.check_collision(block, self.x_change, self.y_change):
-                    block_list.append(block)
-
-        return block_list
-
-    def _resolve_collisions(self, block_list: List[Any]) -> None:
+        # Only blocks overlapping the target hitbox can collide, so clip the 5x6 search
+        # area around the player to the rows and columns that hitbox covers
+        column = int(self.x // BLOCK_SIZE)
+        first_dx = max(-2, int(self.x_change // BLOCK_SIZE) - column)
+        last_dx = min(2, -int(-(self.x_change + self.width) // BLOCK_SIZE) - 1 - column)
+        first_dy = max(-2, int(self.y_change // BLOCK_SIZE) - self.chunk_y)
+        last_dy = min(3, -int(-(self.y_change + self.height) // BLOCK_SIZE) - 1 - self.chunk_y)
+
+        # Edges of the target hitbox
+        target_left, target_top = self.x_change, self.y_change
+        target_right, target_bottom = target_left + self.width, target_top + self.height
+
+        # The AABB test splits into a test per column and a test per row, so both are
+        # done once up front instead of for every cell.
+        # Columns past either edge of the middle chunk fall in its neighbors
+        columns = []
+        for raw_x in range(self.chunk_x + first_dx, self.chunk_x + last_dx + 1):
+            current_chunk = chunks[1 + raw_x // CHUNK_WIDTH]
+            if current_chunk is None:
+                continue
+            check_x = raw_x % CHUNK_WIDTH
+            block_x = check_x * BLOCK_SIZE + current_chunk.offset
+            if target_left < block_x + BLOCK_SIZE and target_right > block_x:
+                columns.append((current_chunk.block_types, check_x, block_x))
+
+        # Skip rows that are out of bounds or miss the target hitbox
+        rows = [
+            check_y
+            for check_y in range(max(0, self.chunk_y + first_dy), min(CHUNK_HEIGHT, self.chunk_y + last_dy + 1))
+            if target_top < (check_y + 1) * BLOCK_SIZE and target_bottom > check_y * BLOCK_SIZE
+        ]
+
+        # Collect the solid cells in one flat comprehension; only their positions
+        # are needed to resolve the collision
+        block_list = [
+            (block_x, check_y * BLOCK_SIZE)
+            for check_y in rows
+            for block_types, check_x, block_x in columns
+            if block_types[check_y][check_x] not in NON_SOLID_BLOCKS
+        ]
+
+        # Check the rows around the player's feet for water; chunk_x is always
+        # within the center chunk
+        feet_row = int((self.y + self.height - BLOCK_SIZE/2) // BLOCK_SIZE)
+        feet_column = [row[self.chunk_x] for row in chunks[1].block_types[max(0, feet_row - 1):max(0, feet_row + 2)]]
+        in_water = WATER in feet_column
+
+        return block_list, in_water
+
+    def _resolve_collisions(self, block_list: List[Tuple[int, int]]) -> None:
         """
         Resolve collisions with blocks.
 
-        Args:
-            block_list: A list of blocks that the entity is colliding with.
-        """
-        self.grounded = False
-        for block in block_list:
-            # Calculate overlap in x and y axes
-            x_overlap = min(self.x + self.width, block.x + block.width) - max(self.x, block.x)
-            y_overlap = min(self.y + self.height, block.y + block.height) - max(self.y, block.y)
-
-            # Determine collision side and adjust position
-            if x_overlap < y_overlap:
-                if self.x < block.x:  # Collision on the left
-                    self.x_change = block.x - self.width
-                else:  # Collision on the right
-                    self.x_change = block.x + block.width
-            else:
-                if self.y < block.y:  # Collision from above
-                    self.y_change = block.y - self.height
-                else:  # Collision from below
-                    self.grounded = True
-                    self.y_change = block.y + block.height
-
-    def check_collision(self, block: Any, x: float, y: float) -> bool:
-        """
-        Check if the entity collides with a block at the given position.
+        Each block is classified as a horizontal or a vertical collision, and only
+        one block per axis is resolved: the one with the widest contact along the
+        other axis. Other blocks on the same axis would only overwrite the result.
 
         Args:
-            block: The block to check collision with.
-            x: The x-coordinate to check collision at.
-            y: The y-coordinate to check collision at.
-
-        Returns:
-            True if the entity collides with the block, False otherwise.
+            block_list: The (x, y) world positions of the blocks that the entity is colliding with.
         """
-        # Check if rectangles overlap in both x and y axes (AABB collision)
-        return (x < block.x + block.width and
-                x + self.width > block.x and
-                y < block.y + block.height and
-                y + self.height > block.y)
+        # Work on local copies of the hitbox, the loop only reads the current position
+        left, top = self.x, self.y
+        right, bottom = left + self.width, top + self.height
+        x_change, y_change = self.x_change, self.y_change
+        grounded = False
 
-    def _check_if_in_water(self, chunks: Tuple[Any, Any, Any]) -> bool:
-        """
-        Check if the entity is in water.
-
-        Args:
-            chunks: A tuple containing the left, center, and right chunks to check.
-
-        Returns:
-            True if the entity is in water, False otherwise.
-        """
-        left_chunk, center_chunk, right_chunk = chunks
-
-        # Calculate the player's feet position (bottom of hitbox)
-        feet_y = self.y + self.height - BLOCK_SIZE/2
-
-        # Check a small area around the player for water blocks
-        for dy in range(-1, 2):  # Check one block above and below feet
-            check_y = math.floor(feet_y / BLOCK_SIZE) + dy
+        # The block resolved on each axis, with its contact along the other axis
+        x_block = y_block = None
+        x_contact = y_contact = float('-inf')
 
-            # Skip if out of bounds
-            if not (0 <= check_y < CHUNK_HEIGHT):
-                continue
-
-            # Check blocks at player's horizontal position
-            check_x = self.chunk_x
-
-            # Determine which chunk to check
-            current_chunk = center_chunk
-            if check_x < 0:
-                if left_chunk:
-                    check_x = CHUNK_WIDTH + check_x
-                    current_chunk = left_chunk
-            elif check_x >= CHUNK_WIDTH:
-                if right_chunk:
-                    check_x = check_x - CHUNK_WIDTH
-                    current_chunk = right_chunk
-                else:
-                    continue
-
-            # Skip if out of bounds
-            if not (0 <= check_x < CHUNK_WIDTH):
-                continue
+        for block in block_list:
+            block_x, block_y = block
 
-            # Get the block and check if it's water
-            block = current_chunk.blocks[check_y][check_x]
-            if isinstance(block, Block) and block.block_type == WATER:
-                return True
+            # Calculate overlap in x and y axes (every block is BLOCK_SIZE square)
+            x_overlap = min(right, block_x + BLOCK_SIZE) - max(left, block_x)
+            y_overlap = min(bottom, block_y + BLOCK_SIZE) - max(top, block_y)
 
-        return False
+            # Determine collision axis and keep the block with the widest contact
+            if x_overlap < y_overlap:
+                if y_overlap > x_contact:
+                    x_block, x_contact = block, y_overlap
+            elif x_overlap > y_contact:
+                y_block, y_contact = block, x_overlap
+
+        # Adjust position
+        if x_block:
+            block_x = x_block[0]
+            if left < block_x:  # Collision on the left
+                x_change = block_x - self.width
+            else:  # Collision on the right
+                x_change = block_x + BLOCK_SIZE
+
+        if y_block:
+            block_y = y_block[1]
+            if top < block_y:  # Collision from above, the entity lands on the block
+                grounded = True
+                y_change = block_y - self.height
+            else:  # Collision from below
+                y_change = block_y + BLOCK_SIZE
+
+        self.x_change, self.y_change = x_change, y_change
+        self.grounded = grounded
 
     def get_surface_type(self, chunks: Tuple[Any, Any, Any]) -> str:
         """
@@ -280,49 +244,28 @@ class Hitbox(Entity):
         if not self.grounded:
             return ""  # Not standing on any surface
 
-        left_chunk, center_chunk, right_chunk = chunks
+        # chunk_x is always within the center chunk
+        center_chunk = chunks[1]
 
         # Calculate the player's feet position (bottom of hitbox)
         feet_y = self.y + self.height + 1  # Just below the feet
 
         # Check the block below the player's feet
-        check_y = math.floor(feet_y / BLOCK_SIZE)
-        check_x = self.chunk_x
+        check_y = int(feet_y // BLOCK_SIZE)
 
         # Skip if out of bounds
         if not (0 <= check_y < CHUNK_HEIGHT):
             return ""
 
-        # Determine which chunk to check
-        current_chunk = center_chunk
-        if check_x < 0:
-            if left_chunk:
-                check_x = CHUNK_WIDTH + check_x
-                current_chunk = left_chunk
-            else:
-                return ""
-        elif check_x >= CHUNK_WIDTH:
-            if right_chunk:
-                check_x = check_x - CHUNK_WIDTH
-                current_chunk = right_chunk
-            else:
-                return ""
-
-        # Skip if out of bounds
-        if not (0 <= check_x < CHUNK_WIDTH):
-            return ""
-
         # Get the block below the player's feet
-        block = current_chunk.blocks[check_y][check_x]
-        if not isinstance(block, Block):
-            return ""
+        block_type = center_chunk.block_types[check_y][self.chunk_x]
 
         # Determine surface type based on block type
-        if block.block_type in [GRASS, DIRT]:
+        if block_type in [GRASS, DIRT]:
             return "grass/dirt"
-        elif block.block_type in [DIAMOND, GOLD, IRON, COAL]:
+        elif block_type in [DIAMOND, GOLD, IRON, COAL]:
             return "blocks"
-        elif block.block_type in [STONE, COBBLE_STONE]:
+        elif block_type in [STONE, COBBLE_STONE]:
             return "stone"
         else:
             return ""
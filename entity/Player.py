@@ -14,9 +14,13 @@ class Player(Hitbox):
 
     Attributes:
         image_copy (pygame.Surface): A copy of the original player image.
+        image_flipped (pygame.Surface): The player image mirrored to face left.
         facingLeft (bool): Whether the player is facing left.
+        stillFacingLeft (bool): Whether the player was facing left in the previous frame.
     """
 
+    __slots__ = ('image_copy', 'image_flipped', 'stillFacingLeft', 'facingLeft')
+
     def __init__(self) -> None:
         """
         Initialize a new Player entity.
@@ -29,6 +33,11 @@ class Player(Hitbox):
 
         # Store a copy of the original image for flipping
         self.image_copy = self.image.copy()
+        self.image_copy.set_colorkey((0, 0, 0))  # Make black transparent
+
+        # Flip the image once up front instead of every frame
+        self.image_flipped = pg.transform.flip(self.image_copy, True, False)
+        self.image_flipped.set_colorkey((0, 0, 0))
 
         # Player starts facing left
         self.stillFacingLeft = False
@@ -39,7 +48,7 @@ class Player(Hitbox):
         Render the player on the screen.
 
         This method updates the player's rectangle position based on the camera
-        position, flips the player image if facing left, and then draws the
+        position, picks the flipped player image if facing left, and then draws the
         player's image on the screen.
 
         Args:
@@ -50,13 +59,8 @@ class Player(Hitbox):
         self.rect.x = self.x - camera.x
         self.rect.y = self.y - camera.y
 
-        # Flip the player image if facing left
-        if self.facingLeft:
-            self.image = pg.transform.flip(self.image_copy, True, False)
-        else:
-            self.image = self.image_copy
-
+        # Use the flipped player image if facing left
+        self.image = self.image_flipped if self.facingLeft else self.image_copy
 
-        self.image.set_colorkey((0, 0, 0))  # Make black transparent
         # Draw the player on the screen
         screen.blit(self.image, self.rect)
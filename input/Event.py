@@ -5,38 +5,115 @@ This module provides functions for polling and handling game events
 such as keyboard input, mouse input, and window close events.
 """
 import pygame as pg
-from typing import Any, Optional
+from typing import Any, List, Optional, Tuple
 
+# High-volume event types the game never handles, kept out of the event queue
+IGNORED_EVENTS: Tuple[int, ...] = (
+    pg.TEXTINPUT, pg.TEXTEDITING, pg.FINGERMOTION, pg.MULTIGESTURE,
+    pg.JOYAXISMOTION, pg.JOYBALLMOTION, pg.JOYHATMOTION,
+    pg.CONTROLLERAXISMOTION, pg.CONTROLLERSENSORUPDATE,
+)
 
-def poll_events(keyboard: Any, mouse: Optional[Any] = None) -> None:
+# Event types only the crafting menu handles, blocked while it is closed
+MENU_EVENTS: Tuple[int, ...] = (pg.MOUSEMOTION, pg.MOUSEWHEEL)
+
+
+def filter_events(menu_open: bool = False) -> None:
+    """
+    Keep the high-volume event types the game doesn't handle out of the event queue.
+
+    Only bursty event types are blocked; everything else, including the window
+    events SDL and pygame's SCALED display mode rely on, stays enabled. Mouse
+    motion and wheel events are only used by the crafting menu, so they are
+    blocked while it is closed.
+
+    Args:
+        menu_open: Whether the crafting menu is open.
+    """
+    pg.event.set_allowed(None)
+    pg.event.set_blocked(IGNORED_EVENTS if menu_open else IGNORED_EVENTS + MENU_EVENTS)
+
+
+def coalesce_events(events: List[pg.event.Event]) -> List[pg.event.Event]:
+    """
+    Drop all but the last mouse motion event, keeping the order of the rest.
+
+    A burst of mouse motion events only needs handling once, at the final
+    cursor position.
+
+    Args:
+        events: The events polled this frame.
+
+    Returns:
+        The events with stale mouse motion events removed.
+    """
+    MOUSEMOTION = pg.MOUSEMOTION
+    motions = [event for event in events if event.type == MOUSEMOTION]
+    if len(motions) < 2:
+        return events
+
+    last_motion = motions[-1]
+    return [event for event in events if event.type != MOUSEMOTION or event is last_motion]
+
+
+def get_events(timeout_ms: int = 0) -> List[pg.event.Event]:
+    """
+    Get all pending pygame events, first waiting up to timeout_ms for one if none are queued.
+
+    Unlike a fixed sleep, the OS wakes the game as soon as input arrives, so
+    idle frames cost no CPU without delaying the response to input.
+
+    Args:
+        timeout_ms: The longest time to wait for an event in milliseconds, or 0 to not wait.
+
+    Returns:
+        The pending events, oldest first.
+    """
+    events = pg.event.get()
+    if events or timeout_ms <= 0:
+        return events
+
+    event = pg.event.wait(timeout_ms)
+    if event.type == pg.NOEVENT:
+        return events
+    return [event] + pg.event.get()
+
+
+def poll_events(keyboard: Any, mouse: Optional[Any] = None, timeout_ms: int = 0) -> List[pg.event.Event]:
     """
     Poll and handle all pending pygame events.
 
     This function processes all pending events in the pygame event queue,
-    including window close events, keyboard events, and mouse events.
+    including window close events, keyboard events, and mouse events. The
+    events are coalesced first, then handed to each input handler as one batch.
 
     Args:
         keyboard: The keyboard input handler to update with keyboard events.
         mouse: The mouse input handler to update with mouse events.
+        timeout_ms: The longest time to wait for an event if none are queued, or 0 to not wait.
+
+    Returns:
+        The polled events, for UI that handles them itself (e.g. the crafting menu).
     """
-    # Reset mouse click events at the beginning of each frame
+    events = coalesce_events(get_events(timeout_ms))
+
     if mouse:
+        # Reset mouse click events at the beginning of each frame
         mouse.reset_click_events()
 
-    # Update mouse position
-    if mouse:
+        # Update mouse position
         mouse.x, mouse.y = pg.mouse.get_pos()
 
-    for event in pg.event.get():
-        # Handle window close event
-        if event.type == pg.QUIT:
+    # Handle window close event
+    QUIT = pg.QUIT
+    for event in events:
+        if event.type == QUIT:
             pg.quit()
             quit()
 
-        # Handle keyboard events (key press and release)
-        if event.type == pg.KEYDOWN or event.type == pg.KEYUP:
-            keyboard.handle_events(event)
+    # Handle keyboard and mouse events (key and button press and release)
+    keyboard.handle_batch(events)
+    if mouse:
+        mouse.handle_batch(events)
 
-        # Handle mouse events (button press and release)
-        if mouse and (event.type == pg.MOUSEBUTTONDOWN or event.type == pg.MOUSEBUTTONUP):
-            mouse.handle_events(event)
+    return events
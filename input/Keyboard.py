@@ -1,5 +1,75 @@
+from __future__ import annotations
+
 import pygame as pg
-from typing import Dict, Any
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from typing import Dict, Any, Iterable
+
+# Bit of each tracked key in Keyboard.state. The number keys take the lowest
+# bits, so the bit index of a number key is its hotbar slot.
+KEY_1 = 1 << 0
+KEY_2 = 1 << 1
+KEY_3 = 1 << 2
+KEY_4 = 1 << 3
+KEY_5 = 1 << 4
+KEY_6 = 1 << 5
+KEY_7 = 1 << 6
+KEY_8 = 1 << 7
+KEY_9 = 1 << 8
+KEY_UP = 1 << 9
+KEY_DOWN = 1 << 10
+KEY_LEFT = 1 << 11
+KEY_RIGHT = 1 << 12
+KEY_W = 1 << 13
+KEY_A = 1 << 14
+KEY_S = 1 << 15
+KEY_D = 1 << 16
+KEY_SPACE = 1 << 17
+KEY_E = 1 << 18
+
+# Masks of keys that share an action
+NUMBER_KEYS = KEY_1 | KEY_2 | KEY_3 | KEY_4 | KEY_5 | KEY_6 | KEY_7 | KEY_8 | KEY_9
+JUMP_KEYS = KEY_UP | KEY_W | KEY_SPACE
+LEFT_KEYS = KEY_LEFT | KEY_A
+RIGHT_KEYS = KEY_RIGHT | KEY_D
+
+# Keyboard state bit updated by each tracked key
+KEY_MASKS: Dict[int, int] = {
+    pg.K_UP: KEY_UP,
+    pg.K_DOWN: KEY_DOWN,
+    pg.K_LEFT: KEY_LEFT,
+    pg.K_RIGHT: KEY_RIGHT,
+    pg.K_w: KEY_W,
+    pg.K_a: KEY_A,
+    pg.K_s: KEY_S,
+    pg.K_d: KEY_D,
+    pg.K_1: KEY_1,
+    pg.K_2: KEY_2,
+    pg.K_3: KEY_3,
+    pg.K_4: KEY_4,
+    pg.K_5: KEY_5,
+    pg.K_6: KEY_6,
+    pg.K_7: KEY_7,
+    pg.K_8: KEY_8,
+    pg.K_9: KEY_9,
+    pg.K_SPACE: KEY_SPACE,
+    pg.K_e: KEY_E,
+}
+
+
+def _key_state(mask: int, doc: str) -> property:
+    """
+    Create a read-only property telling whether the key with the given bit is pressed.
+
+    Args:
+        mask: The bit of the key in Keyboard.state.
+        doc: The docstring of the property.
+
+    Returns:
+        The property.
+    """
+    return property(lambda self: bool(self.state & mask), doc=doc)
 
 
 class Keyboard:
@@ -7,9 +77,12 @@ class Keyboard:
     Handles keyboard input for the game.
 
     This class tracks the state of keyboard keys and provides methods
-    for handling keyboard events.
+    for handling keyboard events. All key states are packed into a single
+    integer bitmask, so combinations of keys can be tested with one AND
+    against the masks defined in this module.
 
     Attributes:
+        state (int): Bitmask of the pressed keys, using the KEY_* bits.
         up (bool): Whether the up arrow key is pressed.
         down (bool): Whether the down arrow key is pressed.
         left (bool): Whether the left arrow key is pressed.
@@ -23,98 +96,72 @@ class Keyboard:
         key_2 (bool): Whether the 2 key is pressed.
         key_3 (bool): Whether the 3 key is pressed.
         key_4 (bool): Whether the 4 key is pressed.
+        number_keys_mask (int): Bitmask of the pressed number keys, bit 0 for the 1 key up to bit 8 for the 9 key.
         e (bool): Whether the E key is pressed.
-        e_pressed (bool): Whether the E key was just pressed this frame.
+        pressed_edges (int): Bitmask of the keys that were just pressed this frame.
     """
 
+    __slots__ = ('state', 'pressed_edges', '_previous_state')
+
+    # Arrow keys
+    up = _key_state(KEY_UP, "Whether the up arrow key is pressed.")
+    down = _key_state(KEY_DOWN, "Whether the down arrow key is pressed.")
+    left = _key_state(KEY_LEFT, "Whether the left arrow key is pressed.")
+    right = _key_state(KEY_RIGHT, "Whether the right arrow key is pressed.")
+
+    # WASD keys
+    w = _key_state(KEY_W, "Whether the W key is pressed.")
+    a = _key_state(KEY_A, "Whether the A key is pressed.")
+    s = _key_state(KEY_S, "Whether the S key is pressed.")
+    d = _key_state(KEY_D, "Whether the D key is pressed.")
+
+    # Space bar
+    space = _key_state(KEY_SPACE, "Whether the space bar is pressed.")
+
+    # Number keys for block selection
+    key_1 = _key_state(KEY_1, "Whether the 1 key is pressed.")
+    key_2 = _key_state(KEY_2, "Whether the 2 key is pressed.")
+    key_3 = _key_state(KEY_3, "Whether the 3 key is pressed.")
+    key_4 = _key_state(KEY_4, "Whether the 4 key is pressed.")
+    key_5 = _key_state(KEY_5, "Whether the 5 key is pressed.")
+    key_6 = _key_state(KEY_6, "Whether the 6 key is pressed.")
+    key_7 = _key_state(KEY_7, "Whether the 7 key is pressed.")
+    key_8 = _key_state(KEY_8, "Whether the 8 key is pressed.")
+    key_9 = _key_state(KEY_9, "Whether the 9 key is pressed.")
+
+    # E key for crafting menu
+    e = _key_state(KEY_E, "Whether the E key is pressed.")
+
     def __init__(self) -> None:
         """Initialize a new Keyboard input handler with all keys unpressed."""
-        # Arrow keys
-        self.up = False
-        self.down = False
-        self.left = False
-        self.right = False
-
-        # WASD keys
-        self.w = False
-        self.a = False
-        self.s = False
-        self.d = False
-
-        # Space bar
-        self.space = False
-
-        # Number keys for block selection
-        self.key_1 = False
-        self.key_2 = False
-        self.key_3 = False
-        self.key_4 = False
-        self.key_5 = False
-        self.key_6 = False
-        self.key_7 = False
-        self.key_8 = False
-        self.key_9 = False
-
-        # E key for crafting menu
-        self.e = False
-        self.e_pressed = False
-        self._e_was_pressed = False  # Track previous frame state
-
-    def handle_events(self, event: pg.event.Event) -> None:
-        """
-        Handle keyboard events to update key states.
+        self.state = 0
 
-        This method updates the state of tracked keys based on
-        keyboard events (key presses and releases).
+        # Keys just pressed this frame, found by comparing with the previous frame's state
+        self.pressed_edges = 0
+        self._previous_state = 0
 
-        Args:
-            event: The pygame event to handle (must be KEYDOWN or KEYUP).
+    @property
+    def number_keys_mask(self) -> int:
+        """Bitmask of the pressed number keys, bit 0 for the 1 key up to bit 8 for the 9 key."""
+        return self.state & NUMBER_KEYS
+
+    def handle_batch(self, events: Iterable[pg.event.Event]) -> None:
+        """
+        Handle all of a frame's events in one pass, ignoring non-keyboard events.
 
-        Precondition: event is KEYDOWN or KEYUP
+        Args:
+            events: The pygame events polled this frame.
         """
-        # Set handle to True for key down events, False for key up events
-        handle = event.type == pg.KEYDOWN
-
-        # Update the appropriate key state based on the event
-        if event.key == pg.K_UP:
-            self.up = handle
-        elif event.key == pg.K_DOWN:
-            self.down = handle
-        elif event.key == pg.K_LEFT:
-            self.left = handle
-        elif event.key == pg.K_RIGHT:
-            self.right = handle
-        elif event.key == pg.K_w:
-            self.w = handle
-        elif event.key == pg.K_a:
-            self.a = handle
-        elif event.key == pg.K_s:
-            self.s = handle
-        elif event.key == pg.K_d:
-            self.d = handle
-        # Number keys for block selection
-        elif event.key == pg.K_1:
-            self.key_1 = handle
-        elif event.key == pg.K_2:
-            self.key_2 = handle
-        elif event.key == pg.K_3:
-            self.key_3 = handle
-        elif event.key == pg.K_4:
-            self.key_4 = handle
-        elif event.key == pg.K_5:
-            self.key_5 = handle
-        elif event.key == pg.K_6:
-            self.key_6 = handle
-        elif event.key == pg.K_7:
-            self.key_7 = handle
-        elif event.key == pg.K_8:
-            self.key_8 = handle
-        elif event.key == pg.K_9:
-            self.key_9 = handle
-        elif event.key == pg.K_SPACE:
-            self.space = handle
-        elif event.key == pg.K_e:
-            self.e = handle
+        KEYDOWN = pg.KEYDOWN
+        KEYUP = pg.KEYUP
+        state = self.state
+        for event in events:
+            event_type = event.type
+            if event_type == KEYDOWN or event_type == KEYUP:
+                mask = KEY_MASKS.get(event.key)
+                if mask:
+                    state = state | mask if event_type == KEYDOWN else state & ~mask
+        self.state = state
 
     def update(self) -> None:
         """
@@ -122,8 +169,22 @@ class Keyboard:
 
         This method should be called once per frame to reset one-frame flags.
         """
-        # Check if E was just pressed (is pressed now but wasn't pressed last frame)
-        self.e_pressed = self.e and not self._e_was_pressed
+        state = self.state
+
+        # Keys that are pressed now but weren't pressed last frame
+        self.pressed_edges = state & ~self._previous_state
 
         # Update the previous frame state for next frame
-        self._e_was_pressed = self.e
\ No newline at end of file
+        self._previous_state = state
+
+    def key_just_pressed(self, mask: int) -> bool:
+        """
+        Check whether any of the given keys was just pressed this frame.
+
+        Args:
+            mask: The KEY_* bits of the keys to check.
+
+        Returns:
+            True if any of the keys went down since the previous frame, False otherwise.
+        """
+        return bool(self.pressed_edges & mask)
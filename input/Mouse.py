@@ -4,9 +4,14 @@ Mouse input handling module for the game.
 This module provides classes for tracking and handling mouse input,
 including position and button clicks.
 """
-from typing import Tuple
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
 import pygame as pg
 
+if TYPE_CHECKING:
+    from typing import Iterable, Tuple
+
 class Mouse:
     """
     Handles mouse input for the game.
@@ -23,6 +28,8 @@ class Mouse:
         left_click_event (bool): Whether a left click event occurred this frame.
     """
 
+    __slots__ = ('x', 'y', 'right_click', 'left_click', 'right_click_event', 'left_click_event')
+
     def __init__(self) -> None:
         """Initialize a new Mouse input handler with default values."""
         self.x = 0
@@ -52,33 +59,37 @@ class Mouse:
         self.x = x
         self.y = y
 
-    def handle_events(self, event: 'pg.event.Event') -> None:
+    def handle_batch(self, events: Iterable[pg.event.Event]) -> None:
         """
-        Handle mouse events to update mouse state.
+        Handle all of a frame's events in one pass, ignoring non-mouse events.
 
-        This method updates the state of the mouse based on mouse events
-        (button presses and releases).
+        The position is updated from the latest motion or button press event.
+        Click events accumulate until reset_click_events is called at the start
+        of the next frame.
 
         Args:
-            event: The pygame event to handle (must be MOUSEBUTTONDOWN or MOUSEBUTTONUP).
+            events: The pygame events polled this frame.
         """
-        # Reset click events at the beginning of each frame
-        self.left_click_event = False
-        self.right_click_event = False
-
-        # Handle mouse button events
-        if event.type == pg.MOUSEBUTTONDOWN:
-            if event.button == 1:  # Left mouse button
-                self.left_click = True
-                self.left_click_event = True
-            elif event.button == 3:  # Right mouse button
-                self.right_click = True
-                self.right_click_event = True
-        elif event.type == pg.MOUSEBUTTONUP:
-            if event.button == 1:  # Left mouse button
-                self.left_click = False
-            elif event.button == 3:  # Right mouse button
-                self.right_click = False
+        MOUSEBUTTONDOWN = pg.MOUSEBUTTONDOWN
+        MOUSEBUTTONUP = pg.MOUSEBUTTONUP
+        MOUSEMOTION = pg.MOUSEMOTION
+        for event in events:
+            event_type = event.type
+            if event_type == MOUSEMOTION:
+                self.x, self.y = event.pos
+            elif event_type == MOUSEBUTTONDOWN:
+                self.x, self.y = event.pos  # Where the click happened, not where the cursor is now
+                if event.button == 1:  # Left mouse button
+                    self.left_click = True
+                    self.left_click_event = True
+                elif event.button == 3:  # Right mouse button
+                    self.right_click = True
+                    self.right_click_event = True
+            elif event_type == MOUSEBUTTONUP:
+                if event.button == 1:  # Left mouse button
+                    self.left_click = False
+                elif event.button == 3:  # Right mouse button
+                    self.right_click = False
 
     def reset_click_events(self) -> None:
         """Reset click events at the beginning of each frame."""
@@ -4,30 +4,89 @@ Crafting menu module for the game.
 This module provides the CraftingMenu class for displaying and interacting
 with the crafting menu.
 """
+from __future__ import annotations
+
 import pygame as pg
-from typing import List, Dict, Tuple, Any, Optional, Callable
+from typing import TYPE_CHECKING
 
 from world import CraftingRecipes
 from rendering import SpriteManager
-from world.Block import BLOCK_SIZE, AIR, COAL_BLOCK, OAK_LOG, DIAMOND, DIAMOND_BLOCK, GOLD, GOLD_BLOCK, IRON, \
-    IRON_BLOCK, OAK_PLANK, COAL, STONE, COBBLE_STONE
-
-BLOCK_NAMES = {
-    AIR : "Air",
-    COAL_BLOCK : "Coal",
-    OAK_LOG : "Oak Log",
-    DIAMOND : "Diamond",
-    DIAMOND_BLOCK : "Diamond Block",
-    GOLD : "Gold",
-    GOLD_BLOCK : "Gold Block",
-    IRON : "Iron",
-    IRON_BLOCK : "Iron Block",
-    OAK_PLANK  : "Oak Plank",
-    COAL : "Coal",
-    STONE : "Stone",
-    COBBLE_STONE : "Cobblestone"
+from world.Block import BLOCK_SIZE, AIR, GRASS, DIRT, STONE, COAL, IRON, GOLD, DIAMOND, OAK_LOG, LEAVES, \
+    OAK_PLANK, COBBLE_STONE, DIAMOND_BLOCK, GOLD_BLOCK, IRON_BLOCK, COAL_BLOCK, POPPY, PUMPKIN, ANDESITE, GRANITE, \
+    DIORITE, WATER, FURNACE
+
+if TYPE_CHECKING:
+    from typing import List, Dict, Tuple, Any, Optional, Callable
+
+# Display name of each block type
+_NAMES_BY_TYPE: Dict[int, str] = {
+    AIR: "Air",
+    GRASS: "Grass",
+    DIRT: "Dirt",
+    STONE: "Stone",
+    COAL: "Coal",
+    IRON: "Iron",
+    GOLD: "Gold",
+    DIAMOND: "Diamond",
+    OAK_LOG: "Oak Log",
+    LEAVES: "Leaves",
+    OAK_PLANK: "Oak Plank",
+    COBBLE_STONE: "Cobblestone",
+    DIAMOND_BLOCK: "Diamond Block",
+    GOLD_BLOCK: "Gold Block",
+    IRON_BLOCK: "Iron Block",
+    COAL_BLOCK: "Coal",
+    POPPY: "Poppy",
+    PUMPKIN: "Pumpkin",
+    ANDESITE: "Andesite",
+    GRANITE: "Granite",
+    DIORITE: "Diorite",
+    WATER: "Water",
+    FURNACE: "Furnace",
 }
 
+# Display name of each block, indexed by block type
+BLOCK_NAMES: Tuple[str, ...] = tuple(_NAMES_BY_TYPE[block_type] for block_type in range(FURNACE + 1))
+
+
+class RecipeButton:
+    """
+    A button in the crafting menu that crafts one recipe.
+
+    Attributes:
+        original_rect (pg.Rect): The button's screen rectangle before scrolling.
+        recipe (Dict): The recipe the button crafts.
+        can_craft (bool): Whether the inventory has the recipe's inputs.
+        hover (bool): Whether the mouse is over the button.
+        index (int): The button's position in the menu.
+        labels_enabled (Tuple[Tuple[pg.Surface, Tuple[int, int]], ...]): The button's text in the enabled color, with offsets.
+        labels_disabled (Tuple[Tuple[pg.Surface, Tuple[int, int]], ...]): The button's text in the disabled color, with offsets.
+    """
+
+    __slots__ = ('original_rect', 'recipe', 'can_craft', 'hover', 'index', 'labels_enabled', 'labels_disabled')
+
+    def __init__(self, original_rect: pg.Rect, recipe: Dict, index: int,
+                 labels_enabled: Tuple[Tuple[pg.Surface, Tuple[int, int]], ...],
+                 labels_disabled: Tuple[Tuple[pg.Surface, Tuple[int, int]], ...]) -> None:
+        """
+        Initialize a new RecipeButton that can't be crafted and isn't hovered.
+
+        Args:
+            original_rect: The button's screen rectangle before scrolling.
+            recipe: The recipe the button crafts.
+            index: The button's position in the menu.
+            labels_enabled: The button's text in the enabled color, with offsets.
+            labels_disabled: The button's text in the disabled color, with offsets.
+        """
+        self.original_rect = original_rect
+        self.recipe = recipe
+        self.can_craft = False
+        self.hover = False
+        self.index = index
+        self.labels_enabled = labels_enabled
+        self.labels_disabled = labels_disabled
+
+
 class CraftingMenu:
     """
     Handles the display and interaction with the crafting menu with scrolling support.
@@ -56,6 +115,9 @@ class CraftingMenu:
         self.screen_width = screen_width
         self.screen_height = screen_height
 
+        # Print scroll changes and draw scroll info on screen, for development only
+        self.debug = False
+
         # Set menu dimensions (centered on screen)
         self.menu_width = 400
         self.menu_height = 300
@@ -66,10 +128,29 @@ class CraftingMenu:
         self.font = pg.font.Font(None, 24)
         self.title_font = pg.font.Font(None, 36)
 
+        # The menu background, border and title never change, so they are drawn once
+        self.background_surface = pg.Surface((self.menu_width, self.menu_height), pg.SRCALPHA)
+        self.background_surface.fill(self.MENU_BACKGROUND_COLOR)
+        pg.draw.rect(
+            self.background_surface,
+            self.MENU_BORDER_COLOR,
+            (0, 0, self.menu_width, self.menu_height),
+            self.MENU_BORDER_WIDTH
+        )
+        self.title_surface = self.title_font.render("Crafting", True, self.TITLE_TEXT_COLOR)
+        self.title_rect = self.title_surface.get_rect(centerx=self.menu_x + self.menu_width // 2, y=self.menu_y + 10)
+
         # Initialize button list
         self.buttons = []
         self.inventory = None
 
+        # The recipes the buttons were laid out for, and the counts of the recipe
+        # inputs the buttons' can_craft flags were last computed from
+        self.recipes = None
+        self.relevant_block_types: Tuple[int, ...] = ()
+        self.inventory_fingerprint: Optional[Tuple[int, ...]] = None
+        self.inventory_revision: Optional[int] = None  # Inventory revision the menu last updated from
+
         # Scrolling variables
         self.scroll_offset = 0  # How much we've scrolled down (in pixels)
         self.scroll_speed = 30  # Pixels per scroll step
@@ -85,6 +166,18 @@ class CraftingMenu:
         self.scroll_area_height = self.menu_height - self.title_height - self.padding
         self.scroll_area_bottom = self.scroll_area_top + self.scroll_area_height
 
+        # Buttons are stacked in one column, so the button under a point can be computed directly
+        self.buttons_x = self.menu_x + self.padding
+        self.buttons_top = self.scroll_area_top + self.padding // 2
+        self.button_width = self.menu_width - (self.padding * 2)
+        self.button_stride = self.button_height + self.button_spacing
+        self.hovered_button: Optional[RecipeButton] = None
+
+        # The buttons and scroll indicator are drawn onto a transparent surface covering
+        # the scroll area, which is only redrawn when the menu contents change
+        self.content_surface = pg.Surface((self.menu_width, self.scroll_area_height), pg.SRCALPHA)
+        self.dirty = True
+
     def get_max_scroll(self) -> int:
         """Calculate the maximum scroll offset."""
         if not self.buttons:
@@ -99,33 +192,105 @@ class CraftingMenu:
         max_scroll = self.get_max_scroll()
         self.scroll_offset = max(0, min(self.scroll_offset, max_scroll))
 
+    def scroll(self, amount: int) -> None:
+        """
+        Scroll the recipe list, marking the menu contents for redrawing if it moved.
+
+        Args:
+            amount: The number of pixels to scroll down, negative to scroll up.
+        """
+        old_offset = self.scroll_offset
+        self.scroll_offset += amount
+        self.clamp_scroll()
+        if self.scroll_offset != old_offset:
+            self.dirty = True
+
     def update(self, inventory: Any) -> None:
-        """Update the crafting menu state."""
+        """
+        Update the crafting menu state.
+
+        The buttons are only rebuilt when the recipe list changes, and their
+        can_craft flags are only recomputed when the count of a block used by
+        some recipe changed since the last update. Once given an inventory,
+        the menu also updates itself when drawn after the inventory changed.
+        """
+        same_inventory = inventory is self.inventory
         self.inventory = inventory
         recipes = CraftingRecipes.get_all_recipes()
 
-        # Clear and rebuild buttons
-        self.buttons = []
-        button_width = self.menu_width - (self.padding * 2)
+        # Nothing to do if neither the recipes nor the inventory changed
+        if recipes is self.recipes and same_inventory and inventory.revision == self.inventory_revision:
+            return
+        self.inventory_revision = inventory.revision
+
+        # Rebuild buttons only if the recipes changed
+        if recipes is not self.recipes:
+            self.recipes = recipes
+            self.relevant_block_types = tuple({block_type for recipe in recipes for block_type in recipe['inputs']})
+            self.inventory_fingerprint = None
+
+            self.buttons = []
+            self.hovered_button = None
+            self.dirty = True
+            button_width = self.button_width
+
+            for i, recipe in enumerate(recipes):
+                # Calculate ORIGINAL position (before applying scroll)
+                button_x = self.buttons_x
+                button_y = self.buttons_top + self.button_stride * i
+
+                # Recipe labels are rendered once in both colors, since recipes never change
+                button = RecipeButton(
+                    pg.Rect(button_x, button_y, button_width, self.button_height),
+                    recipe,
+                    i,
+                    self.render_labels(recipe, self.BUTTON_TEXT_COLOR, button_width),
+                    self.render_labels(recipe, self.BUTTON_TEXT_DISABLED_COLOR, button_width)
+                )
+                self.buttons.append(button)
+
+        # Recompute which recipes can be crafted only if a recipe input count changed
+        fingerprint = tuple(inventory.get_block_count(block_type) for block_type in self.relevant_block_types)
+        if fingerprint != self.inventory_fingerprint:
+            self.inventory_fingerprint = fingerprint
+            self.dirty = True
+            for button in self.buttons:
+                button.can_craft = CraftingRecipes.can_craft(button.recipe, inventory)
 
-        for i, recipe in enumerate(recipes):
-            # Calculate ORIGINAL position (before applying scroll)
-            button_x = self.menu_x + self.padding
-            button_y = self.scroll_area_top + self.padding // 2 + (self.button_height + self.button_spacing) * i
+        # Clamp scroll after updating buttons
+        self.clamp_scroll()
 
-            can_craft = CraftingRecipes.can_craft(recipe, inventory)
+    def render_labels(self, recipe: Dict, text_color: Tuple[int, int, int],
+                      button_width: int) -> Tuple[Tuple[pg.Surface, Tuple[int, int]], ...]:
+        """
+        Render the text of a recipe button.
 
-            button = {
-                'original_rect': pg.Rect(button_x, button_y, button_width, self.button_height),
-                'recipe': recipe,
-                'can_craft': can_craft,
-                'hover': False,
-                'index': i
-            }
-            self.buttons.append(button)
+        Args:
+            recipe: The recipe the button crafts.
+            text_color: The color to render the text in.
+            button_width: The width of the button in pixels.
 
-        # Clamp scroll after updating buttons
-        self.clamp_scroll()
+        Returns:
+            The name, inputs and output text surfaces, each with its offset from the button's top left corner.
+        """
+        output_type, output_quantity = recipe['output']
+
+        # Recipe name
+        name_text = self.font.render(recipe['name'], True, text_color)
+
+        # Input materials, with a generic name for block types that have no display name
+        input_text = "Requires: " + ", ".join(
+            f"{quantity}x {BLOCK_NAMES[block_type] if 0 <= block_type < len(BLOCK_NAMES) else f'Block {block_type}'}"
+            for block_type, quantity in recipe['inputs'].items()
+        )
+        inputs_text = self.font.render(input_text, True, text_color)
+
+        # Output item, right aligned and vertically centered
+        outputs_text = self.font.render(f"Creates: {output_quantity}", True, text_color)
+        outputs_offset = (button_width - 10 - outputs_text.get_width(),
+                          self.button_height // 2 - outputs_text.get_height() // 2)
+
+        return (name_text, (10, 5)), (inputs_text, (10, 30)), (outputs_text, outputs_offset)
 
     def handle_event(self, event: pg.event.Event) -> Optional[Dict]:
         """Handle events including scrolling."""
@@ -137,132 +302,164 @@ class CraftingMenu:
 
             if menu_rect.collidepoint(mouse_pos):
                 # Scroll up = negative y, scroll down = positive y
-                self.scroll_offset -= event.y * self.scroll_speed
-                self.clamp_scroll()
-                print(f"Mouse scroll: event.y={event.y}, new offset={self.scroll_offset}")  # Debug
+                self.scroll(-event.y * self.scroll_speed)
+                if self.debug:
+                    print(f"Mouse scroll: event.y={event.y}, new offset={self.scroll_offset}")
                 return None
 
         # Handle scrolling with keyboard
         elif event.type == pg.KEYDOWN:
             if event.key == pg.K_UP:
-                self.scroll_offset -= self.scroll_speed
-                self.clamp_scroll()
-                print(f"Key UP: new offset={self.scroll_offset}")  # Debug
+                self.scroll(-self.scroll_speed)
+                if self.debug:
+                    print(f"Key UP: new offset={self.scroll_offset}")
                 return None
             elif event.key == pg.K_DOWN:
-                self.scroll_offset += self.scroll_speed
-                self.clamp_scroll()
-                print(f"Key DOWN: new offset={self.scroll_offset}")  # Debug
+                self.scroll(self.scroll_speed)
+                if self.debug:
+                    print(f"Key DOWN: new offset={self.scroll_offset}")
                 return None
 
         # Handle mouse movement for hover detection
         elif event.type == pg.MOUSEMOTION:
-            mouse_pos = pg.mouse.get_pos()
-
-            for button in self.buttons:
-                # Calculate current displayed position
-                display_rect = self.get_button_display_rect(button)
+            button = self.button_at(event.pos)
 
-                # Check if mouse is over this button and button is visible
-                if (self.is_button_visible(button) and
-                    display_rect.collidepoint(mouse_pos)):
-                    button['hover'] = True
-                else:
-                    button['hover'] = False
+            # Move the hover highlight if the mouse moved onto another button
+            if button is not self.hovered_button:
+                if self.hovered_button:
+                    self.hovered_button.hover = False
+                if button:
+                    button.hover = True
+                self.hovered_button = button
+                self.dirty = True
 
         # Handle mouse clicks
         elif event.type == pg.MOUSEBUTTONDOWN and event.button == 1:  # Left click
-            mouse_pos = pg.mouse.get_pos()
+            button = self.button_at(event.pos)
+            if button and button.can_craft:
+                return button.recipe
 
-            for button in self.buttons:
-                display_rect = self.get_button_display_rect(button)
+        return None
 
-                if (self.is_button_visible(button) and
-                    display_rect.collidepoint(mouse_pos) and
-                    button['can_craft']):
-                    return button['recipe']
+    def button_at(self, pos: Tuple[int, int]) -> Optional[RecipeButton]:
+        """
+        Find the visible button under a point on the screen.
 
-        return None
+        Since the buttons are stacked at a fixed stride, the button index is
+        computed from the point's height instead of testing every button.
 
-    def get_button_display_rect(self, button: Dict) -> pg.Rect:
-        """Get the current display rectangle for a button (with scroll applied)."""
-        original_rect = button['original_rect']
-        return pg.Rect(
-            original_rect.x,
-            original_rect.y - self.scroll_offset,  # Apply scroll offset
-            original_rect.width,
-            original_rect.height
-        )
+        Args:
+            pos: The (x, y) screen position to test.
+
+        Returns:
+            The button under the point, or None if there is no visible button there.
+        """
+        x, y = pos
+        if not self.buttons_x <= x < self.buttons_x + self.button_width:
+            return None
+
+        index, button_y = divmod(y + self.scroll_offset - self.buttons_top, self.button_stride)
+        if not 0 <= index < len(self.buttons) or button_y >= self.button_height:
+            return None
 
-    def is_button_visible(self, button: Dict) -> bool:
+        button = self.buttons[index]
+        return button if self.is_button_visible(button) else None
+
+    def is_button_visible(self, button: RecipeButton) -> bool:
         """Check if a button is currently visible in the scroll area."""
-        display_rect = self.get_button_display_rect(button)
-        return (display_rect.bottom > self.scroll_area_top and
-                display_rect.top < self.scroll_area_bottom)
+        # Compare the scrolled edges directly rather than building a display rect
+        top = button.original_rect.y - self.scroll_offset
+        return top + self.button_height > self.scroll_area_top and top < self.scroll_area_bottom
+
+    def visible_range(self) -> range:
+        """
+        Get the indices of the buttons currently visible in the scroll area.
+
+        Since the buttons are stacked at a fixed stride, the range is computed
+        from the scroll offset instead of testing every button.
+
+        Returns:
+            The range of visible button indices.
+        """
+        # Offset of the scroll area's top and bottom edges from the first button's top
+        area_top = self.scroll_area_top - self.buttons_top + self.scroll_offset
+        area_bottom = self.scroll_area_bottom - self.buttons_top + self.scroll_offset
+
+        # First button whose bottom is below the area's top, last whose top is above its bottom
+        start = max(0, (area_top - self.button_height) // self.button_stride + 1)
+        stop = min(len(self.buttons), -(-area_bottom // self.button_stride))
+        return range(start, stop)
 
     def draw(self, screen: pg.Surface) -> None:
         """Draw the crafting menu to the screen."""
 
-        # Draw menu background
-        menu_surface = pg.Surface((self.menu_width, self.menu_height), pg.SRCALPHA)
-        menu_surface.fill(self.MENU_BACKGROUND_COLOR)
-        screen.blit(menu_surface, (self.menu_x, self.menu_y))
+        # Pick up inventory changes (e.g. from crafting) before drawing
+        if self.inventory is not None and self.inventory.revision != self.inventory_revision:
+            self.update(self.inventory)
 
-        # Draw menu border
-        pg.draw.rect(
-            screen,
-            self.MENU_BORDER_COLOR,
-            (self.menu_x, self.menu_y, self.menu_width, self.menu_height),
-            self.MENU_BORDER_WIDTH
-        )
+        # Draw menu background and border
+        screen.blit(self.background_surface, (self.menu_x, self.menu_y))
 
         # Draw title
-        title_text = self.title_font.render("Crafting", True, self.TITLE_TEXT_COLOR)
-        title_rect = title_text.get_rect(centerx=self.menu_x + self.menu_width // 2, y=self.menu_y + 10)
-        screen.blit(title_text, title_rect)
-
-        # Set clipping rectangle for scrollable content
-        scroll_clip_rect = pg.Rect(
-            self.menu_x,
-            self.scroll_area_top,
-            self.menu_width,
-            self.scroll_area_height
-        )
-        old_clip = screen.get_clip()
-        screen.set_clip(scroll_clip_rect)
-
-        # Draw buttons
-        visible_count = 0
-        for button in self.buttons:
-            if self.is_button_visible(button):
-                visible_count += 1
-                display_rect = self.get_button_display_rect(button)
-                self.draw_button(screen, button, display_rect)
-
-        # Restore clipping
-        screen.set_clip(old_clip)
+        screen.blit(self.title_surface, self.title_rect)
+
+        # Redraw the scrollable content only if it changed since the last frame
+        if self.dirty:
+            self.draw_content()
+            self.dirty = False
+        screen.blit(self.content_surface, (self.menu_x, self.scroll_area_top))
+
+        # Debug info
+        if self.debug:
+            visible_count = len(self.visible_range())
+            debug_text = f"Scroll: {self.scroll_offset}/{self.get_max_scroll()}, Visible: {visible_count}/{len(self.buttons)}"
+            debug_surface = self.font.render(debug_text, True, (255, 255, 0))
+            screen.blit(debug_surface, (10, 10))
+
+    def draw_content(self) -> None:
+        """Draw the visible buttons and the scroll indicator onto the content surface."""
+        self.content_surface.fill((0, 0, 0, 0))
+
+        # Draw buttons, relative to the scroll area (the surface clips them to it). Their
+        # labels are collected and drawn in one call once all backgrounds are drawn
+        label_blits: List[Tuple[pg.Surface, Tuple[int, int]]] = []
+        buttons = self.buttons
+        for index in self.visible_range():
+            button = buttons[index]
+            display_rect = button.original_rect.move(-self.menu_x, -self.scroll_area_top - self.scroll_offset)
+            self.draw_button(self.content_surface, button, display_rect, label_blits)
+
+        # pygame-ce's fblits skips the per-blit bookkeeping of blits; plain pygame lacks it
+        if hasattr(self.content_surface, 'fblits'):
+            self.content_surface.fblits(label_blits)
+        else:
+            self.content_surface.blits(label_blits, doreturn=0)
 
         # Draw scroll indicator
-        self.draw_scroll_indicator(screen)
+        self.draw_scroll_indicator(self.content_surface)
 
-        # Debug info (remove in production)
-        debug_text = f"Scroll: {self.scroll_offset}/{self.get_max_scroll()}, Visible: {visible_count}/{len(self.buttons)}"
-        debug_surface = self.font.render(debug_text, True, (255, 255, 0))
-        screen.blit(debug_surface, (10, 10))
+    def draw_button(self, screen: pg.Surface, button: RecipeButton, display_rect: pg.Rect,
+                    label_blits: List[Tuple[pg.Surface, Tuple[int, int]]]) -> None:
+        """
+        Draw a single button's background and border, and queue its labels.
 
-    def draw_button(self, screen: pg.Surface, button: Dict, display_rect: pg.Rect) -> None:
-        """Draw a single button."""
+        Args:
+            screen: The surface to draw the button on.
+            button: The button to draw.
+            display_rect: Where to draw the button on the surface.
+            label_blits: The blit sequence the button's pre-rendered labels are appended to.
+        """
 
         # Determine button color based on state
-        if not button['can_craft']:
+        if not button.can_craft:
             bg_color = self.BUTTON_DISABLED_COLOR
-            text_color = self.BUTTON_TEXT_DISABLED_COLOR
-        elif button['hover']:
+            labels = button.labels_disabled
+        elif button.hover:
             bg_color = self.BUTTON_HOVER_COLOR
-            text_color = self.BUTTON_TEXT_COLOR
+            labels = button.labels_enabled
         else:
             bg_color = self.BUTTON_BACKGROUND_COLOR
-            text_color = self.BUTTON_TEXT_COLOR
+            labels = button.labels_enabled
 
         # Draw button background
         pg.draw.rect(screen, bg_color, display_rect)
@@ -270,41 +467,19 @@ class CraftingMenu:
         # Draw button border
         pg.draw.rect(screen, self.BUTTON_BORDER_COLOR, display_rect, self.BUTTON_BORDER_WIDTH)
 
-        # Get recipe data
-        recipe = button['recipe']
-        recipe_name = recipe['name']
-        output_type, output_quantity = recipe['output']
-
-        # Draw recipe name
-        name_text = self.font.render(recipe_name, True, text_color)
-        name_rect = name_text.get_rect(x=display_rect.x + 10, y=display_rect.y + 5)
-        screen.blit(name_text, name_rect)
-
-        # Draw input materials
-        input_text = "Requires: "
-        for block_type, quantity in recipe['inputs'].items():
-            input_text += f"{quantity}x {BLOCK_NAMES[block_type]}, "
-        input_text = input_text[:-2]  # Remove trailing comma and space
-
-        inputs_text = self.font.render(input_text, True, text_color)
-        inputs_rect = inputs_text.get_rect(x=display_rect.x + 10, y=display_rect.y + 30)
-        screen.blit(inputs_text, inputs_rect)
-
-        # Draw output item
-        output_text = f"Creates: {output_quantity}"
-        outputs_text = self.font.render(output_text, True, text_color)
-        outputs_rect = outputs_text.get_rect(right=display_rect.right - 10, centery=display_rect.centery)
-        screen.blit(outputs_text, outputs_rect)
+        # Queue the pre-rendered recipe name, input materials and output item
+        x, y = display_rect.topleft
+        label_blits += [(surface, (x + dx, y + dy)) for surface, (dx, dy) in labels]
 
     def draw_scroll_indicator(self, screen: pg.Surface) -> None:
-        """Draw a simple scroll indicator."""
+        """Draw a simple scroll indicator onto the content surface."""
         max_scroll = self.get_max_scroll()
 
         if max_scroll > 0:
             # Draw scroll track
             track_rect = pg.Rect(
-                self.menu_x + self.menu_width - 15,
-                self.scroll_area_top,
+                self.menu_width - 15,
+                0,
                 10,
                 self.scroll_area_height
             )
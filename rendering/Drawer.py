@@ -128,6 +128,10 @@ class Drawer:
         camera (Any): The camera object that determines the view position.
         screen (pg.Surface): The pygame surface representing the game window.
         font (pg.font.Font): The font used for text rendering.
+        inventory_sprites (Dict[int, pg.Surface]): Block sprites pre-scaled to the hotbar icon size.
+        hotbar_background (pg.Surface): The pre-built semi-transparent hotbar background.
+        fps_prefix_surface (pg.Surface): The pre-rendered "FPS: " label.
+        fps_digit_surfaces (List[pg.Surface]): Pre-rendered digits 0-9 for the FPS counter.
     """
 
     # Display settings
@@ -167,11 +171,17 @@ class Drawer:
         # Set our camera object
         self.camera = camera
 
-        # Create the window
-        self.screen = pg.display.set_mode(
-            (self.SCREEN_WIDTH, self.SCREEN_HEIGHT), 
-            vsync=1
-        )
+        # Create the window. SCALED presents the frame through SDL's hardware renderer as a
+        # texture, which is also the only software-surface mode where vsync is honored
+        try:
+            self.screen = pg.display.set_mode(
+                (self.SCREEN_WIDTH, self.SCREEN_HEIGHT),
+                pg.SCALED,
+                vsync=1
+            )
+        except pg.error:
+            # Vsync isn't available on every driver, fall back to an unsynchronized renderer
+            self.screen = pg.display.set_mode((self.SCREEN_WIDTH, self.SCREEN_HEIGHT), pg.SCALED)
 
         pg.display.set_caption(self.WINDOW_TITLE)
 
@@ -186,9 +196,25 @@ class Drawer:
 
         pg.display.set_icon(SpriteManager.block_sprites[GRASS])
 
+        # Scale hotbar icons once; the block sprites are already in display format
+        self.inventory_sprites: Dict[int, pg.Surface] = {
+            block_type: pg.transform.scale(sprite, (self.INVENTORY_BLOCK_SIZE, self.INVENTORY_BLOCK_SIZE))
+            for block_type, sprite in SpriteManager.block_sprites.items()
+        }
+
+        # Build the hotbar background once in the display's alpha format
+        hotbar_width = 9 * (self.INVENTORY_BLOCK_SIZE + self.INVENTORY_SPACING) + self.INVENTORY_SPACING
+        hotbar_height = self.INVENTORY_BLOCK_SIZE + self.INVENTORY_SPACING * 2
+        self.hotbar_background = pg.Surface((hotbar_width, hotbar_height), pg.SRCALPHA).convert_alpha()
+        self.hotbar_background.fill(self.INVENTORY_BACKGROUND_COLOR)
+
         # Set game font
         self.font = pg.font.Font(None, 36)
 
+        # Pre-render the FPS counter text so it is only laid out, not rasterized, each frame
+        self.fps_prefix_surface = self.font.render('FPS: ', True, self.FPS_TEXT_COLOR)
+        self.fps_digit_surfaces = [self.font.render(str(digit), True, self.FPS_TEXT_COLOR) for digit in range(10)]
+
         # Track time for animations
         self.last_time = pg.time.get_ticks() / 1000.0
 
@@ -197,7 +223,8 @@ class Drawer:
         Draw a complete frame to the screen.
 
         This method clears the screen, draws the background, renders all chunks,
-        draws the player, and updates the display.
+        draws the player, and updates the display. Drawing is skipped while the
+        window is minimized.
 
         Args:
             player: The player entity to render.
@@ -212,16 +239,24 @@ class Drawer:
         dt = current_time - self.last_time
         self.last_time = current_time
 
+        # Keep the sky animation running even when the frame isn't drawn
+        self.sky.update(dt, self.camera.x)
+
+        # Nothing is visible while the window is minimized, so skip drawing and presenting
+        if not pg.display.get_active():
+            return
+
         # Clear the screen and draw background
         self.screen.fill(self.BACKGROUND_COLOR)
 
-        # Update and draw the sky
-        self.sky.update(dt, self.camera.x)
+        # Draw the sky
         self.sky.draw(self.screen)
 
-        # Loop over each chunk and render it
+        # Collect the visible blocks of every chunk and draw them in one batched call
+        blit_sequence = []
         for chunk in chunk_list:
-            chunk.render_chunk(self.screen, self.camera)
+            chunk.collect_blits(blit_sequence, self.camera, self.SCREEN_WIDTH, self.SCREEN_HEIGHT)
+        self.screen.blits(blit_sequence, doreturn=0)
 
         # Highlight the block under the mouse cursor if mouse position is provided
         if mouse_pos:
@@ -287,14 +322,20 @@ class Drawer:
         Args:
             fps: The current frames per second to display.
         """
-        # Render the FPS text
-        fps_text = self.font.render(f'FPS: {fps}', True, self.FPS_TEXT_COLOR)
+        # Look up the pre-rendered label and digits
+        surfaces = [self.fps_prefix_surface]
+        surfaces.extend(self.fps_digit_surfaces[int(digit)] for digit in str(max(fps, 0)))
 
         # Position the text in the top right corner
-        fps_rect = fps_text.get_rect(topright=self.FPS_POSITION)
+        x = self.FPS_POSITION[0] - sum(surface.get_width() for surface in surfaces)
+        y = self.FPS_POSITION[1]
 
         # Draw the text to the screen
-        self.screen.blit(fps_text, fps_rect)
+        blit_sequence = []
+        for surface in surfaces:
+            blit_sequence.append((surface, (x, y)))
+            x += surface.get_width()
+        self.screen.blits(blit_sequence, doreturn=0)
 
     def draw_inventory(self, inventory: Any) -> None:
         """
@@ -322,12 +363,12 @@ class Drawer:
         hotbar_x = (self.SCREEN_WIDTH - hotbar_width) // 2
         hotbar_y = self.SCREEN_HEIGHT - hotbar_height - 20  # 20px margin from bottom
 
-        # Create a surface for the background
-        background = pg.Surface((hotbar_width, hotbar_height), pg.SRCALPHA)
-        background.fill(self.INVENTORY_BACKGROUND_COLOR)
-
         # Draw the background
-        self.screen.blit(background, (hotbar_x, hotbar_y))
+        self.screen.blit(self.hotbar_background, (hotbar_x, hotbar_y))
+
+        # Icons and counts are collected and drawn in one blits() call, the borders after them
+        blit_sequence = []
+        borders = []
 
         # Draw each block in the hotbar
         for i, block_type in enumerate(collected_blocks):
@@ -335,39 +376,39 @@ class Drawer:
             block_x = hotbar_x + self.INVENTORY_SPACING + i * block_size_with_spacing
             block_y = hotbar_y + self.INVENTORY_SPACING
 
-            # Get the sprite for this block
-            block_sprite = SpriteManager.get_block_sprite(block_type)
+            # Get the pre-scaled sprite for this block
+            block_sprite = self.inventory_sprites.get(block_type)
 
             if block_sprite:
-                # Scale the block sprite to the inventory block size
-                scaled_sprite = pg.transform.scale(block_sprite, 
-                                                  (self.INVENTORY_BLOCK_SIZE, self.INVENTORY_BLOCK_SIZE))
-
                 # Draw the block sprite
-                self.screen.blit(scaled_sprite, (block_x, block_y))
+                blit_sequence.append((block_sprite, (block_x, block_y)))
 
                 # Draw the block count
                 block_count = inventory.get_block_count(block_type)
                 count_text = self.font.render(str(block_count), True, self.INVENTORY_TEXT_COLOR)
                 count_rect = count_text.get_rect(bottomright=(block_x + self.INVENTORY_BLOCK_SIZE - 2, 
                                                              block_y + self.INVENTORY_BLOCK_SIZE - 2))
-                self.screen.blit(count_text, count_rect)
+                blit_sequence.append((count_text, count_rect))
 
                 # Determine border color based on whether this is the selected block
                 border_color = self.INVENTORY_SELECTED_COLOR if block_type == selected_block else self.INVENTORY_BORDER_COLOR
+                borders.append((border_color, (block_x, block_y)))
+
+        self.screen.blits(blit_sequence, doreturn=0)
 
-                # Draw a border around the block
-                pg.draw.rect(
-                    self.screen,
-                    border_color,
-                    (
-                        block_x,
-                        block_y,
-                        self.INVENTORY_BLOCK_SIZE,
-                        self.INVENTORY_BLOCK_SIZE
-                    ),
-                    self.INVENTORY_BORDER_WIDTH
-                )
+        # Draw a border around each block
+        for border_color, (block_x, block_y) in borders:
+            pg.draw.rect(
+                self.screen,
+                border_color,
+                (
+                    block_x,
+                    block_y,
+                    self.INVENTORY_BLOCK_SIZE,
+                    self.INVENTORY_BLOCK_SIZE
+                ),
+                self.INVENTORY_BORDER_WIDTH
+            )
 
         for i in range(len(collected_blocks), 9):
             border_color = self.INVENTORY_BORDER_COLOR
@@ -4,8 +4,10 @@ Sprite management module for the game.
 This module provides functions for loading, managing, and retrieving
 sprites for blocks and entities in the game.
 """
+import functools
+from concurrent.futures import ThreadPoolExecutor
 import pygame as pg
-from typing import Dict, Optional, Union
+from typing import Dict, List, Optional, Union
 
 from world.Block import BLOCK_SIZE, AIR, GRASS, DIRT, STONE, COAL, IRON, GOLD, DIAMOND, OAK_LOG, LEAVES, BEDROCK, \
     OAK_PLANK, COBBLE_STONE, DIAMOND_BLOCK, GOLD_BLOCK, IRON_BLOCK, COAL_BLOCK, POPPY, PUMPKIN, ANDESITE, GRANITE, \
@@ -51,16 +53,31 @@ ITEM_SPRITE_PATHS = {
     "Coal": "./rendering/sprites/coal.png"
 }
 
+# Number of threads decoding sprite images at startup
+SPRITE_DECODE_WORKERS = 4
+
+# Block sprites indexed directly by block type for hot rendering loops.
+# The list has one spare slot at the end so BEDROCK (-1) indexes it like any other type.
+block_sprite_table: List[Optional[pg.Surface]] = [None] * (max(SPRITE_PATHS) + 2)
+
 def load_block_sprites() -> None:
     """
     Load all block sprites into memory.
 
     This function loads and scales all block sprites from their respective
-    image files and stores them in the block_sprites dictionary.
+    image files and stores them in the block_sprites dictionary and the
+    block_sprite_table list. Sprites are converted to the display's pixel
+    format, so it must be called after pg.display.set_mode().
+
+    The image files are decoded in parallel on worker threads; converting and
+    scaling them stays on the main thread, which owns the display.
     """
-    for block_type, path in SPRITE_PATHS.items():
+    with ThreadPoolExecutor(max_workers=SPRITE_DECODE_WORKERS) as executor:
+        decoded = {block_type: executor.submit(pg.image.load, path) for block_type, path in SPRITE_PATHS.items()}
+
+    for block_type, future in decoded.items():
         try:
-            image = pg.image.load(path)
+            image = future.result()
 
             # Convert with alpha channel for transparency
             if block_type == POPPY:
@@ -78,28 +95,21 @@ def load_block_sprites() -> None:
         except Exception as e:
             print(f"Error loading sprite for block type {block_type}: {e}")
             # Create a fallback sprite (purple square for missing textures)
-            fallback = pg.Surface((BLOCK_SIZE, BLOCK_SIZE))
+            fallback = pg.Surface((BLOCK_SIZE, BLOCK_SIZE)).convert()
             fallback.fill((255, 0, 255))  # Purple color
             block_sprites[block_type] = fallback
 
-
-def get_block_sprite(block_type: int) -> Optional[pg.Surface]:
-    """
-    Get the sprite for a specific block type.
-
-    Args:
-        block_type: The type of block to get the sprite for.
-
-    Returns:
-        The sprite surface for the specified block type, or None if not found.
-    """
-    return block_sprites.get(block_type)
+        block_sprite_table[block_type] = block_sprites[block_type]
 
 
+@functools.lru_cache(maxsize=32)
 def load_entity_sprite(entity_type: str) -> Optional[pg.Surface]:
     """
     Load and return the sprite for a specific entity type.
 
+    Results are cached per entity type, so each sprite file is only loaded and
+    scaled once. The returned surface is shared and must not be modified.
+
     Args:
         entity_type: The type of entity to load the sprite for.
 
@@ -115,7 +125,7 @@ def load_entity_sprite(entity_type: str) -> Optional[pg.Surface]:
         except Exception as e:
             print(f"Error loading sprite for entity type {entity_type}: {e}")
             # Create a fallback sprite (red square for missing textures)
-            fallback = pg.Surface((BLOCK_SIZE, BLOCK_SIZE))
+            fallback = pg.Surface((BLOCK_SIZE, BLOCK_SIZE)).convert()
             fallback.fill((255, 0, 0))  # Red color
             return fallback
 
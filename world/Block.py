@@ -1,3 +1,4 @@
+import math
 import random
 from typing import Optional, List, Tuple, Dict, Set, Any
 
@@ -59,16 +60,24 @@ class Block:
 
     A block is a basic unit in the game world that can be of different types
     (air, grass, dirt, stone, ores, etc.) and has a position in the world.
+    Chunks store only block types, so Blocks are short-lived snapshots; they use
+    __slots__ and share their size as class attributes to stay small.
 
     Attributes:
         x (float): The x-coordinate of the block in the game world.
         y (float): The y-coordinate of the block in the game world.
-        width (int): The width of the block in pixels.
-        height (int): The height of the block in pixels.
+        width (int): The width of the block in pixels (shared by all blocks).
+        height (int): The height of the block in pixels (shared by all blocks).
         block_type (int): The type of the block, determining its appearance and behavior.
         water_distance (int): For water blocks, the distance from the source (0 for source blocks).
     """
 
+    __slots__ = ('x', 'y', 'block_type', 'water_distance')
+
+    # Every block has the same size
+    width = BLOCK_SIZE
+    height = BLOCK_SIZE
+
     def __init__(self, x: float, y: float, block_type: int, water_distance: int = 0) -> None:
         """
         Initialize a new Block.
@@ -81,8 +90,6 @@ class Block:
         """
         self.x = x
         self.y = y
-        self.width = BLOCK_SIZE
-        self.height = BLOCK_SIZE
         self.block_type = block_type
         self.water_distance = water_distance
 
@@ -134,7 +141,6 @@ def generate_ore_vein(chunk: Any, ore_type: int, start_x: int, start_y: int, vei
         vein_size: A tuple containing the min and max size of the vein.
         chunk_height: The height of the chunk for boundary checking.
     """
-    from world.Block import Block, STONE  # Import here to avoid circular import
     # Determine vein size - larger veins are rarer
     min_size, max_size = vein_size
     size_range = max_size - min_size
@@ -161,11 +167,10 @@ def generate_ore_vein(chunk: Any, ore_type: int, start_x: int, start_y: int, vei
         x, y = frontier.pop(random.randint(0, len(frontier) - 1))
 
         # Place the ore block if it's stone
-        if (0 <= x < len(chunk.blocks[0]) and 0 <= y < chunk_height and 
-                isinstance(chunk.blocks[y][x], Block) and 
-                chunk.blocks[y][x].block_type == STONE):
+        if (0 <= x < len(chunk.block_types[0]) and 0 <= y < chunk_height and
+                chunk.block_types[y][x] == STONE):
             # Replace stone with ore
-            chunk.blocks[y][x].block_type = ore_type
+            chunk.block_types[y][x] = ore_type
 
             # Add neighboring blocks to the frontier
             for dx, dy in directions:
@@ -182,6 +187,20 @@ def generate_ore_vein(chunk: Any, ore_type: int, start_x: int, start_y: int, vei
                             vein_blocks.add((nx, ny))
 
 
+def stone_blocks_until_vein() -> int:
+    """
+    Sample how many stone blocks to pass over before the next ore vein starts.
+
+    Each stone block starts a vein with probability ORE_GENERATION_CHANCE, so the
+    gap between veins is geometrically distributed. Drawing the gap directly takes
+    one random number per vein instead of one per stone block.
+
+    Returns:
+        The number of stone blocks to skip before starting the next vein.
+    """
+    return int(math.log(1.0 - random.random()) / math.log(1.0 - ORE_GENERATION_CHANCE))
+
+
 def place_ore_veins(chunk: Any, chunk_height: int) -> None:
     """
     Place ore veins throughout the chunk.
@@ -193,16 +212,24 @@ def place_ore_veins(chunk: Any, chunk_height: int) -> None:
         chunk: The chunk to place ore veins in.
         chunk_height: The height of the chunk.
     """
-    from world.Block import Block, STONE  # Import here to avoid circular import
+    block_types = chunk.block_types
+
+    # Stone blocks left to pass over before the next vein starts
+    blocks_until_vein = stone_blocks_until_vein()
+
     # Try to place ore veins
-    for x in range(len(chunk.blocks[0])):
+    for x in range(len(block_types[0])):
         for y in range(chunk_height):
             # Only consider stone blocks
-            if not isinstance(chunk.blocks[y][x], Block) or chunk.blocks[y][x].block_type != STONE:
+            if block_types[y][x] != STONE:
                 continue
 
             # Check if we should start an ore vein
-            if random.random() < ORE_GENERATION_CHANCE:
+            if blocks_until_vein:
+                blocks_until_vein -= 1
+            else:
+                blocks_until_vein = stone_blocks_until_vein()
+
                 # Determine ore type based on depth
                 depth = y / chunk_height  # Normalized depth between 0 and 1
                 ore_type = None
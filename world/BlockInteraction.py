@@ -67,7 +67,7 @@ class BlockInteraction:
             return None, None, block_x, block_y
 
         # Return the block, chunk, and block coordinates
-        return chunk.blocks[block_y][block_x], chunk, block_x, block_y
+        return chunk.get_block(block_x, block_y), chunk, block_x, block_y
 
     @staticmethod
     def is_within_reach(player: Any, block_x: int, block_y: int, chunk: Any) -> bool:
@@ -142,20 +142,12 @@ class BlockInteraction:
                 # If it's a source block, remove all connected water blocks first
                 WaterSimulation.remove_connected_water(chunk, block_x, block_y, chunk_list)
                 # Then replace the source block with air
-                chunk.blocks[block_y][block_x] = Block(
-                    block_x * BLOCK_SIZE + chunk.offset,
-                    block_y * BLOCK_SIZE,
-                    AIR
-                )
+                chunk.set_block(block_x, block_y, AIR)
                 # Return WATER to add to inventory
                 return WATER
             else:
                 # For non-source water blocks, just remove the single block
-                chunk.blocks[block_y][block_x] = Block(
-                    block_x * BLOCK_SIZE + chunk.offset,
-                    block_y * BLOCK_SIZE,
-                    AIR
-                )
+                chunk.set_block(block_x, block_y, AIR)
                 # Non-source water blocks don't give water
                 return AIR
 
@@ -164,11 +156,7 @@ class BlockInteraction:
             broken_block_type = COBBLE_STONE
 
         # Break the block by replacing it with air
-        chunk.blocks[block_y][block_x] = Block(
-            block_x * BLOCK_SIZE + chunk.offset,
-            block_y * BLOCK_SIZE,
-            AIR
-        )
+        chunk.set_block(block_x, block_y, AIR)
 
         # Return the type of block that was broken
         return broken_block_type
@@ -220,10 +208,6 @@ class BlockInteraction:
             WaterSimulation.place_water_source(chunk, block_x, block_y)
         else:
             # Place a regular block
-            chunk.blocks[block_y][block_x] = Block(
-                block_x * BLOCK_SIZE + chunk.offset,
-                block_y * BLOCK_SIZE,
-                block_type
-            )
+            chunk.set_block(block_x, block_y, block_type)
 
         return True
@@ -1,9 +1,11 @@
 import random
 import math
-from typing import List, Union, Any, Optional
+from array import array
+from typing import List, Union, Any, Optional, Tuple, Dict
 import pygame as pg
 
-from world.Block import Block, BLOCK_SIZE, AIR, OAK_LOG, LEAVES, POPPY, PUMPKIN, WATER, GRASS, DIRT, STONE
+from world.Block import Block, BLOCK_SIZE, AIR, OAK_LOG, LEAVES, POPPY, PUMPKIN, WATER, GRASS, DIRT, STONE, \
+    get_block_type, place_ore_veins
 from rendering import SpriteManager
 
 # Number of blocks per chunk
@@ -17,6 +19,28 @@ PUMPKIN_CHANCE = 0.03
 MIN_TREE_TRUNK_HEIGHT = 4
 MAX_TREE_TRUNK_HEIGHT = 6
 
+# Terrain noise constants
+TERRAIN_BASE_HEIGHT = 8
+TERRAIN_FREQUENCY = 0.3
+TERRAIN_AMPLITUDE = 2
+
+# Sine and cosine of the noise phase of every column within a chunk, so a chunk's
+# heightmap only needs one sin/cos pair for its own phase (angle addition)
+COLUMN_SIN = [math.sin(x * TERRAIN_FREQUENCY) for x in range(CHUNK_WIDTH)]
+COLUMN_COS = [math.cos(x * TERRAIN_FREQUENCY) for x in range(CHUNK_WIDTH)]
+
+# Render cache constants
+SECTION_SIZE = 8  # Blocks per side of a cached render section
+SECTION_PIXELS = SECTION_SIZE * BLOCK_SIZE
+SECTION_COLORKEY = (254, 0, 254)  # Marks transparent (air) pixels in a cached section
+
+# Pixel offsets of block columns/rows within a section, and of section rows within a chunk
+TILE_OFFSETS = [i * BLOCK_SIZE for i in range(SECTION_SIZE)]
+SECTION_OFFSETS_Y = [section_y * SECTION_PIXELS for section_y in range(CHUNK_HEIGHT // SECTION_SIZE)]
+
+# Row of water distances for a chunk without water
+EMPTY_WATER_ROW = array('h', [0]) * CHUNK_WIDTH
+
 # Pond generation constants
 POND_CHANCE = 0.05  # 5% chance to generate a pond
 POND_MIN_SIZE = 3
@@ -31,9 +55,15 @@ class Chunk:
     The world is divided into chunks to make rendering and memory management more efficient.
 
     Attributes:
-        blocks (List[List[Block]]): 2D grid of blocks in the chunk.
+        block_types (List[array]): Rows of block types in the chunk, indexed as block_types[y][x].
+        water_distances (List[array]): Rows of water distances from the source, indexed like block_types.
         position (int): The horizontal position of the chunk in the world.
         offset (int): The pixel offset of the chunk from the world origin.
+        sections (Dict[Tuple[int, int], Optional[pg.Surface]]): Pre-rendered surfaces of the
+            currently visible sections of the chunk, keyed by (section_x, section_y).
+            None marks a section that contains only air.
+        section_offsets_x (List[int]): World x-coordinate of each column of sections in the chunk.
+        top_row (int): The highest row that may contain a non-air block; every row above it is air.
     """
 
     def __init__(self, position: int) -> None:
@@ -43,9 +73,33 @@ class Chunk:
         Args:
             position: The horizontal position of the chunk in the world.
         """
-        self.blocks: List[List[Block]] = [[0 for i in range(CHUNK_WIDTH)] for j in range(CHUNK_HEIGHT)]
+        self.block_types: List[array] = [array('b', [AIR]) * CHUNK_WIDTH for _ in range(CHUNK_HEIGHT)]
+        self.top_row = 0
+        self.water_distances: List[array] = [array('h', [0]) * CHUNK_WIDTH for _ in range(CHUNK_HEIGHT)]
+        self.position = position
+        self.offset = 0
+        self.sections: Dict[Tuple[int, int], Optional[pg.Surface]] = {}
+        self.section_offsets_x: List[int] = [0] * (CHUNK_WIDTH // SECTION_SIZE)
+        self.reset(position)
+
+    def reset(self, position: int) -> None:
+        """
+        Move the chunk to a new position and generate fresh terrain for it.
+
+        The block type rows, water distance rows and section offset list are
+        overwritten in place, so a chunk that is no longer needed can be recycled
+        instead of allocating a new one.
+
+        Args:
+            position: The horizontal position of the chunk in the world.
+        """
         self.position = position
         self.offset = position * (CHUNK_WIDTH * BLOCK_SIZE)
+        self.sections = {}
+        for section_x in range(CHUNK_WIDTH // SECTION_SIZE):
+            self.section_offsets_x[section_x] = self.offset + section_x * SECTION_PIXELS
+        for row in self.water_distances:
+            row[:] = EMPTY_WATER_ROW
         self.generate_chunks()
 
     def generate_chunks(self) -> None:
@@ -55,27 +109,17 @@ class Chunk:
         This method creates the terrain by setting block types based on height
         and adds features like ore veins and trees.
         """
-        # First pass: Generate basic terrain (stone, dirt, grass, bedrock)
-        for x in range(CHUNK_WIDTH):
-            # Generate terrain height using smoother noise
-            height = int(8 + math.sin((x + self.position * CHUNK_WIDTH) * 0.3) * 2 + random.uniform(-0.5, 0.5))
+        # Surface height of every column, shared by the terrain and feature passes
+        heights = generate_heightmap(self.position)
 
-            for y in range(CHUNK_HEIGHT):
-                # Import here to avoid circular import
-                from world.Block import get_block_type
-                block_type = get_block_type(height, y, CHUNK_HEIGHT)
-
-                self.blocks[y][x] = Block(x * BLOCK_SIZE + self.offset, y * BLOCK_SIZE, block_type)
+        # First pass: Generate basic terrain (stone, dirt, grass, bedrock)
+        generate_terrain(heights, self.block_types)
 
         # Second pass: Generate ore veins
-        from world.Block import place_ore_veins
         place_ore_veins(self, CHUNK_HEIGHT)
 
         # Third pass: Generate trees
-        for x in range(CHUNK_WIDTH):
-            # Get the height at this x-coordinate
-            height = int(8 + math.sin((x + self.position * CHUNK_WIDTH) * 0.3) * 2 + random.uniform(-0.5, 0.5))
-
+        for x, height in enumerate(heights):
             # Generate trees after terrain generation
             if x > 2 and x < CHUNK_WIDTH - 3 and random.random() < TREE_CHANCE:
                 self.place_tree(x, height + 27)
@@ -95,6 +139,9 @@ class Chunk:
                 self.generate_pond(x, height + 26)
                 continue
 
+        # Everything above the highest non-air block is sky, which rendering can skip
+        self.top_row = next((y for y, row in enumerate(self.block_types) if any(row)), CHUNK_HEIGHT)
+
     def place_tree(self, x: int, y: int) -> None:
         """
         Place a tree at the specified coordinates.
@@ -111,11 +158,7 @@ class Chunk:
         trunk_height = random.randint(MIN_TREE_TRUNK_HEIGHT, MAX_TREE_TRUNK_HEIGHT)
         for i in range(1, trunk_height + 1):
             if y - i >= 0:
-                self.blocks[y - i][x] = Block(
-                    x * BLOCK_SIZE + self.offset,
-                    (y - i) * BLOCK_SIZE,
-                    OAK_LOG
-                )
+                self.block_types[y - i][x] = OAK_LOG
 
         # Place leaves
         leaf_start = y - trunk_height - 2
@@ -127,56 +170,175 @@ class Chunk:
                     continue
 
                 # Check if we can place a leaf here
-                current_block = self.blocks[leaf_y][leaf_x]
-                can_place_leaf = (current_block == 0 or
-                                  (isinstance(current_block, Block) and
-                                   current_block.block_type in [AIR, LEAVES]))
+                can_place_leaf = self.block_types[leaf_y][leaf_x] in (AIR, LEAVES)
 
                 # Place leaf if valid position and within desired shape
                 if can_place_leaf and abs(leaf_x - x) + abs(leaf_y - leaf_start) < 4 :
-                    self.blocks[leaf_y][leaf_x] = Block(
-                        leaf_x * BLOCK_SIZE + self.offset,
-                        leaf_y * BLOCK_SIZE,
-                        LEAVES
-                    )
+                    self.block_types[leaf_y][leaf_x] = LEAVES
 
-    def render_chunk(self, screen: pg.Surface, camera: Any) -> None:
+    def collect_blits(self, blit_sequence: List[Tuple[pg.Surface, Tuple[float, float]]], camera: Any,
+                      screen_width: int, screen_height: int) -> None:
         """
-        Render the chunk to the screen.
+        Append a (surface, position) pair for every visible section to a blit sequence.
 
-        This method draws all visible blocks in the chunk to the screen,
-        taking into account the camera position for scrolling.
+        Blocks are drawn onto cached section surfaces of SECTION_SIZE x SECTION_SIZE
+        blocks the first time a section comes into view, so a frame only blits a
+        handful of section surfaces instead of every block. Sections that leave the
+        view are dropped from the cache to keep memory bounded.
 
         Args:
-            screen: The pygame surface to render to.
+            blit_sequence: The list to append (surface, screen position) pairs to.
             camera: The camera object that determines the view position.
+            screen_width: The width of the screen in pixels.
+            screen_height: The height of the screen in pixels.
         """
-        screen_width = screen.get_width()
-        screen_height = screen.get_height()
+        # The camera is in whole pixels, so adjacent sections line up exactly
+        origin_x = self.offset - camera.x
+        origin_y = -camera.y
+
+        # Range of sections overlapping the screen, skipping the all-air sky above the terrain
+        first_x = max(0, -origin_x // SECTION_PIXELS)
+        last_x = min(CHUNK_WIDTH // SECTION_SIZE - 1, (screen_width - origin_x) // SECTION_PIXELS)
+        first_y = max(self.top_row // SECTION_SIZE, -origin_y // SECTION_PIXELS)
+        last_y = min(CHUNK_HEIGHT // SECTION_SIZE - 1, (screen_height - origin_y) // SECTION_PIXELS)
+
+        # Chunk is entirely off-screen, nothing to draw or keep cached
+        if first_x > last_x or first_y > last_y:
+            self.sections = {}
+            return
 
-        # Only render blocks that are visible on screen
-        for y in range(CHUNK_HEIGHT):
-            block_y = y * BLOCK_SIZE - camera.y
-            if block_y < -BLOCK_SIZE or block_y > screen_height:
-                continue
+        # Screen x-coordinate of every visible column of sections, computed once per frame
+        camera_x = camera.x
+        screen_columns = [
+            (section_x, self.section_offsets_x[section_x] - camera_x) for section_x in range(first_x, last_x + 1)
+        ]
 
-            for x in range(CHUNK_WIDTH):
-                block_x = x * BLOCK_SIZE + self.offset - camera.x
-                if block_x < -BLOCK_SIZE or block_x > screen_width:
-                    continue
+        sections = self.sections
+        visible_sections = {}
+        append = blit_sequence.append
+        for section_y in range(first_y, last_y + 1):
+            screen_y = SECTION_OFFSETS_Y[section_y] + origin_y
+            for section_x, screen_x in screen_columns:
+                key = (section_x, section_y)
+                if key in sections:
+                    surface = sections[key]
+                else:
+                    surface = self._render_section(section_x, section_y)
+                visible_sections[key] = surface
+
+                if surface is not None:
+                    append((surface, (screen_x, screen_y)))
+
+        self.sections = visible_sections
+
+    def _render_section(self, section_x: int, section_y: int) -> Optional[pg.Surface]:
+        """
+        Draw the blocks of one section onto a new surface.
+
+        Args:
+            section_x: The horizontal index of the section within the chunk.
+            section_y: The vertical index of the section within the chunk.
+
+        Returns:
+            The rendered section surface, or None if the section only contains air.
+        """
+        # Hoist lookups out of the loops
+        sprites = SpriteManager.block_sprite_table
+
+        blit_sequence = []
+        start_x = section_x * SECTION_SIZE
+        start_y = section_y * SECTION_SIZE
+        for row_index, row in enumerate(self.block_types[start_y:start_y + SECTION_SIZE]):
+            # Slice out this section's columns once instead of indexing per cell
+            row_slice = row[start_x:start_x + SECTION_SIZE]
+            if not any(row_slice):
+                continue
 
-                block_type = self.blocks[y][x].block_type
+            pixel_y = TILE_OFFSETS[row_index]
+            for pixel_x, block_type in zip(TILE_OFFSETS, row_slice):
                 if block_type != AIR:  # Only render if it's not an air block
-                    screen.blit(
-                        SpriteManager.get_block_sprite(block_type),
-                        (block_x, block_y),
-                    )
+                    blit_sequence.append((sprites[block_type], (pixel_x, pixel_y)))
+
+        if not blit_sequence:
+            return None
+
+        surface = pg.Surface((SECTION_PIXELS, SECTION_PIXELS)).convert()
+        surface.fill(SECTION_COLORKEY)
+        surface.set_colorkey(SECTION_COLORKEY, pg.RLEACCEL)
+        surface.blits(blit_sequence, doreturn=0)
+        return surface
+
+    def get_block(self, x: int, y: int) -> Block:
+        """
+        Build a Block for the given chunk coordinates.
+
+        The chunk only stores block types and water distances, so the returned
+        Block is a snapshot for callers that need positions or sizes (collision,
+        highlighting, interaction). Changes to it are not written back.
+
+        Args:
+            x: The x-coordinate within the chunk.
+            y: The y-coordinate within the chunk.
+
+        Returns:
+            A Block with world coordinates for the given cell.
+        """
+        return Block(
+            x * BLOCK_SIZE + self.offset,
+            y * BLOCK_SIZE,
+            self.block_types[y][x],
+            self.water_distances[y][x]
+        )
+
+    def set_block(self, x: int, y: int, block_type: int, water_distance: int = 0) -> None:
+        """
+        Replace the block at the given chunk coordinates.
+
+        All block changes after generation should go through this method so the
+        cached render sections stay in sync with the block grid.
+
+        Args:
+            x: The x-coordinate within the chunk.
+            y: The y-coordinate within the chunk.
+            block_type: The type of the new block.
+            water_distance: For water blocks, the distance from the source (0 for source blocks).
+        """
+        self.block_types[y][x] = block_type
+        self.water_distances[y][x] = water_distance
+        if block_type != AIR and y < self.top_row:
+            self.top_row = y
+        self.invalidate_region(x, y)
+
+    def invalidate_region(self, x: int, y: int) -> None:
+        """
+        Redraw a single block on its cached section surface.
+
+        Args:
+            x: The x-coordinate of the changed block within the chunk.
+            y: The y-coordinate of the changed block within the chunk.
+        """
+        key = (x // SECTION_SIZE, y // SECTION_SIZE)
+        if key not in self.sections:
+            return
+
+        surface = self.sections[key]
+        if surface is None:
+            # Air-only sections have no surface yet, render it on next use
+            del self.sections[key]
+            return
+
+        tile_rect = pg.Rect((x % SECTION_SIZE) * BLOCK_SIZE, (y % SECTION_SIZE) * BLOCK_SIZE, BLOCK_SIZE, BLOCK_SIZE)
+        surface.fill(SECTION_COLORKEY, tile_rect)
+
+        block_type = self.block_types[y][x]
+        if block_type != AIR:
+            surface.blit(SpriteManager.block_sprite_table[block_type], tile_rect)
 
     def place_poppy(self, x: int, y: int):
-        self.blocks[y][x] = Block(x * BLOCK_SIZE + self.offset, y * BLOCK_SIZE, POPPY)
+        self.block_types[y][x] = POPPY
 
     def place_pumpkin(self, x, y):
-        self.blocks[y][x] = Block(x * BLOCK_SIZE + self.offset, y * BLOCK_SIZE, PUMPKIN)
+        self.block_types[y][x] = PUMPKIN
 
     def generate_pond(self, center_x: int, center_y: int) -> None:
         """
@@ -212,14 +374,9 @@ class Chunk:
 
             # Check if we can place water here (must be above stone level)
             if (0 <= x < CHUNK_WIDTH and 0 <= y < CHUNK_HEIGHT and 
-                    isinstance(self.blocks[y][x], Block) and 
-                    self.blocks[y][x].block_type in [GRASS, DIRT]):
+                    self.block_types[y][x] in (GRASS, DIRT)):
                 # Replace block with water
-                self.blocks[y][x] = Block(
-                    x * BLOCK_SIZE + self.offset,
-                    y * BLOCK_SIZE,
-                    WATER
-                )
+                self.block_types[y][x] = WATER
 
                 # Add neighboring blocks to the frontier
                 for dx, dy in directions:
@@ -236,6 +393,66 @@ class Chunk:
                                 pond_blocks.add((nx, ny))
 
 
+def generate_heightmap(position: int) -> List[int]:
+    """
+    Generate the surface height of every column in a chunk.
+
+    The height follows a sine wave over the world x-coordinate with a little
+    random jitter. The sine is evaluated with the angle addition formula from the
+    precomputed COLUMN_SIN/COLUMN_COS tables, so only the chunk's own phase needs
+    a math call.
+
+    Args:
+        position: The horizontal position of the chunk in the world.
+
+    Returns:
+        A list of CHUNK_WIDTH surface heights.
+    """
+    phase = position * CHUNK_WIDTH * TERRAIN_FREQUENCY
+    sin_phase = math.sin(phase)
+    cos_phase = math.cos(phase)
+    rand = random.random
+
+    # Generate terrain height using smoother noise (jitter in [-0.5, 0.5))
+    return [
+        int(TERRAIN_BASE_HEIGHT + (column_sin * cos_phase + column_cos * sin_phase) * TERRAIN_AMPLITUDE
+            + rand() - 0.5)
+        for column_sin, column_cos in zip(COLUMN_SIN, COLUMN_COS)
+    ]
+
+
+def generate_terrain(heights: List[int], rows: List[array]) -> None:
+    """
+    Generate the basic terrain of a chunk into its rows of block types.
+
+    This is the hot loop of chunk generation, so it fills compact signed-byte
+    rows of block type constants instead of creating a Block per cell. Only a
+    handful of distinct surface heights occur in a chunk, so one column of block
+    types is built per distinct height, and rows where every column agrees (the
+    sky and the deep stone) are filled from a single value. The rows are
+    overwritten in place, so a recycled chunk keeps its row storage.
+
+    Args:
+        heights: The surface height of every column, from generate_heightmap().
+        rows: The CHUNK_HEIGHT rows of CHUNK_WIDTH block types to overwrite.
+    """
+    # One column of block types per distinct surface height
+    columns = {
+        height: [get_block_type(height, y, CHUNK_HEIGHT) for y in range(CHUNK_HEIGHT)]
+        for height in set(heights)
+    }
+    column_list = list(columns.values())
+
+    for y, row in enumerate(rows):
+        block_type = column_list[0][y]
+        if all(column[y] == block_type for column in column_list):
+            # Uniform row, e.g. all air or all stone
+            row[:] = array('b', [block_type]) * CHUNK_WIDTH
+        else:
+            # Row crossing the surface, look up each column's type
+            row[:] = array('b', [columns[height][y] for height in heights])
+
+
 def calculate_player_position(player: Any) -> int:
     """
     Calculate the chunk position that the player is in.
@@ -0,0 +1,140 @@
+"""
+Chunk cache module for the game.
+
+This module provides the ChunkCache class for keeping recently unloaded
+chunks in memory so they don't have to be regenerated when the player
+walks back to them, and for generating upcoming chunks in the background.
+"""
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Dict, Optional
+
+from world.Chunk import Chunk
+
+# Maximum number of unloaded chunks kept in memory
+CHUNK_CACHE_SIZE = 32
+
+
+class ChunkCache:
+    """
+    Least-recently-used cache of unloaded chunks keyed by chunk position.
+
+    Chunks that scroll out of the loaded chunk list are stored here instead of
+    being thrown away. Loading a cached position reuses the stored chunk, which
+    skips terrain generation and keeps any blocks the player broke or placed.
+
+    Chunks just beyond the loaded ones can be prefetched on a worker thread, so
+    they are usually ready by the time the player crosses into them instead of
+    being generated on the main thread mid-frame.
+
+    The chunk evicted from a full cache is kept as a spare and recycled by the
+    next chunk that has to be generated, instead of being left to the garbage
+    collector while a new one is allocated.
+
+    Attributes:
+        capacity (int): The maximum number of chunks kept in the cache.
+        chunks (OrderedDict[int, Chunk]): Cached chunks keyed by position, least recently used first.
+        executor (ThreadPoolExecutor): The worker thread that generates prefetched chunks.
+        pending (Dict[int, Future]): Chunks being generated in the background, keyed by position.
+        spare (Optional[Chunk]): The last evicted chunk, recycled by the next chunk generated.
+    """
+
+    def __init__(self, capacity: int = CHUNK_CACHE_SIZE) -> None:
+        """
+        Initialize an empty ChunkCache.
+
+        Args:
+            capacity: The maximum number of chunks kept in the cache.
+        """
+        self.capacity = capacity
+        self.chunks: "OrderedDict[int, Chunk]" = OrderedDict()
+        self.executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="chunk-gen")
+        self.pending: Dict[int, Future] = {}
+        self.spare: Optional[Chunk] = None
+
+    def get_chunk(self, position: int) -> Chunk:
+        """
+        Get the chunk at the given position, generating it if it isn't cached.
+
+        A cached chunk is removed from the cache, since it is now loaded. A chunk
+        that is still being prefetched is waited for rather than generated twice.
+
+        Args:
+            position: The horizontal position of the chunk in the world.
+
+        Returns:
+            The cached chunk, or a newly generated one.
+        """
+        chunk = self.chunks.pop(position, None)
+        if chunk is None:
+            future = self.pending.pop(position, None)
+            chunk = future.result() if future else generate_chunk(position, self.take_spare())
+        return chunk
+
+    def prefetch(self, position: int) -> None:
+        """
+        Start generating the chunk at the given position in the background.
+
+        Does nothing if the chunk is already cached or being generated. Finished
+        prefetches the player never reached are moved into the cache.
+
+        Args:
+            position: The horizontal position of the chunk in the world.
+        """
+        # Move finished background chunks into the cache
+        for done_position in [p for p, future in self.pending.items() if future.done()]:
+            if done_position != position:
+                self.store(self.pending.pop(done_position).result())
+
+        if position in self.chunks or position in self.pending:
+            return
+
+        self.pending[position] = self.executor.submit(generate_chunk, position, self.take_spare())
+
+    def take_spare(self) -> Optional[Chunk]:
+        """
+        Take the spare chunk out of the cache so it can be recycled.
+
+        Returns:
+            The last evicted chunk, or None if there is none.
+        """
+        spare, self.spare = self.spare, None
+        return spare
+
+    def store(self, chunk: Chunk) -> None:
+        """
+        Store an unloaded chunk, evicting the least recently used one if full.
+
+        Args:
+            chunk: The chunk that was unloaded.
+        """
+        # Cached render sections are only needed while the chunk is on screen
+        chunk.sections = {}
+
+        self.chunks[chunk.position] = chunk
+        self.chunks.move_to_end(chunk.position)
+
+        if len(self.chunks) > self.capacity:
+            _, self.spare = self.chunks.popitem(last=False)
+
+    def close(self) -> None:
+        """Shut down the background generation worker, cancelling prefetches that haven't started."""
+        self.executor.shutdown(cancel_futures=True)
+        self.pending.clear()
+
+
+def generate_chunk(position: int, spare: Optional[Chunk] = None) -> Chunk:
+    """
+    Generate the chunk at the given position, recycling a spare chunk if given.
+
+    Args:
+        position: The horizontal position of the chunk in the world.
+        spare: An unused chunk to regenerate in place, or None to create a new one.
+
+    Returns:
+        The generated chunk.
+    """
+    if spare is None:
+        return Chunk(position)
+    spare.reset(position)
+    return spare
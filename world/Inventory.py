@@ -23,6 +23,7 @@ class Inventory:
         collected_blocks (Dict[int, int]): Dictionary mapping block types to quantities.
         selected_block (int): The currently selected block type.
         selected_index (int): The index of the currently selected block in the hotbar.
+        revision (int): Incremented whenever block quantities change, so views can tell when to refresh.
     """
 
     # List of block types that can be collected (grass, stone, log, iron)
@@ -33,6 +34,7 @@ class Inventory:
         """Initialize a new Inventory with no blocks collected."""
         # Dictionary to track collected blocks and their quantities
         self.collected_blocks: Dict[int, int] = {}
+        self.revision = 0
 
         # Start with some blocks for testing (remove in production)
 
@@ -56,6 +58,7 @@ class Inventory:
                 self.collected_blocks[block_type] += quantity
             else:
                 self.collected_blocks[block_type] = quantity
+            self.revision += 1
 
             # If this is our first block, select it
             if self.select_block == AIR:
@@ -74,6 +77,7 @@ class Inventory:
         """
         if block_type in self.collected_blocks and self.collected_blocks[block_type] >= quantity:
             self.collected_blocks[block_type] -= quantity
+            self.revision += 1
 
             # If we run out of this block, remove it from inventory and update selection
             if self.collected_blocks[block_type] <= 0:
@@ -7,7 +7,7 @@ water flow behavior in the game world.
 import random
 from typing import List, Any, Optional, Tuple, Set
 
-from world.Block import Block, AIR, WATER, BLOCK_SIZE, OAK_LOG, POPPY
+from world.Block import AIR, WATER, OAK_LOG, POPPY
 from world.Chunk import CHUNK_WIDTH, CHUNK_HEIGHT
 
 class WaterSimulation:
@@ -63,12 +63,12 @@ class WaterSimulation:
         """
         # Process water blocks from bottom to top, left to right
         # This ensures water flows downward first
+        block_types = chunk.block_types
         for y in range(CHUNK_HEIGHT - 1, -1, -1):
+            row = block_types[y]
             for x in range(CHUNK_WIDTH):
-                block = chunk.blocks[y][x]
-
                 # Skip if not a water block or already updated
-                if not isinstance(block, Block) or block.block_type != WATER:
+                if row[x] != WATER:
                     continue
 
                 # Create a unique identifier for this block
@@ -108,26 +108,20 @@ class WaterSimulation:
         if y >= CHUNK_HEIGHT - 1:
             return False
 
-        # Get the current water block and its distance from source
-        current_block = chunk.blocks[y][x]
-        current_distance = current_block.water_distance
+        # Get the current water block's distance from source
+        current_distance = chunk.water_distances[y][x]
 
         # Check if we've reached the maximum spread distance
 
 
 
         # Get the block below
-        block_below = chunk.blocks[y + 1][x]
+        block_below = chunk.block_types[y + 1][x]
 
         # If the block below is air, replace it with water
-        if isinstance(block_below, Block) and (block_below.block_type == AIR or block_below.block_type == POPPY):
+        if block_below == AIR or block_below == POPPY:
             # Create a new water block with increased distance
-            chunk.blocks[y + 1][x] = Block(
-                x * BLOCK_SIZE + chunk.offset,
-                (y + 1) * BLOCK_SIZE,
-                WATER,
-                current_distance + 1  # Increment distance from source
-            )
+            chunk.set_block(x, y + 1, WATER, current_distance + 1)  # Increment distance from source
 
             # Mark the new water block as updated
             updated_blocks.add((chunk.position, x, y + 1))
@@ -148,15 +142,13 @@ class WaterSimulation:
             chunk_list: The list of all chunks.
             updated_blocks: Set of blocks that have been updated this frame.
         """
-        # Get the current water block and its distance from source
-        current_block = chunk.blocks[y][x]
-        current_distance = current_block.water_distance
+        # Get the current water block's distance from source
+        current_distance = chunk.water_distances[y][x]
 
         # Check if there's space below for water to flow down
         has_space_below = False
         if y < CHUNK_HEIGHT - 1:
-            block_below = chunk.blocks[y + 1][x]
-            if isinstance(block_below, Block) and block_below.block_type == AIR:
+            if chunk.block_types[y + 1][x] == AIR:
                 has_space_below = True
 
         # Only apply the MAX_SPREAD_DISTANCE limit if there's no space below
@@ -187,12 +179,12 @@ class WaterSimulation:
 
         # Check if we can flow left
         if left_chunk and 0 <= left_x < CHUNK_WIDTH:
-            left_block = left_chunk.blocks[y][left_x]
-            if isinstance(left_block, Block) and left_block.block_type == POPPY:
+            left_block = left_chunk.block_types[y][left_x]
+            if left_block == POPPY:
                 # Remove poppy and allow water to flow there
                 can_flow_left = True
 
-            elif isinstance(left_block, Block) and (left_block.block_type == AIR or left_block.block_type == OAK_LOG):
+            elif left_block == AIR or left_block == OAK_LOG:
                 can_flow_left = True
 
         # Check right block
@@ -212,52 +204,31 @@ class WaterSimulation:
 
         # Check if we can flow right
         if right_chunk and 0 <= right_x < CHUNK_WIDTH:
-            right_block = right_chunk.blocks[y][right_x]
-            if isinstance(right_block, Block) and right_block.block_type == POPPY:
+            right_block = right_chunk.block_types[y][right_x]
+            if right_block == POPPY:
                 # Remove poppy and allow water to flow there
                 can_flow_right = True
 
-            elif isinstance(right_block, Block) and (
-                    right_block.block_type == AIR or right_block.block_type == OAK_LOG):
+            elif right_block == AIR or right_block == OAK_LOG:
                 can_flow_right = True
 
         # Flow in available directions
         if can_flow_left and can_flow_right:
             # Flow in both directions
             # Left
-            left_chunk.blocks[y][left_x] = Block(
-                left_x * BLOCK_SIZE + left_chunk.offset,
-                y * BLOCK_SIZE,
-                WATER,
-                current_distance + 1  # Increment distance from source
-            )
+            left_chunk.set_block(left_x, y, WATER, current_distance + 1)  # Increment distance from source
             updated_blocks.add((left_chunk.position, left_x, y))
 
             # Right
-            right_chunk.blocks[y][right_x] = Block(
-                right_x * BLOCK_SIZE + right_chunk.offset,
-                y * BLOCK_SIZE,
-                WATER,
-                current_distance + 1  # Increment distance from source
-            )
+            right_chunk.set_block(right_x, y, WATER, current_distance + 1)  # Increment distance from source
             updated_blocks.add((right_chunk.position, right_x, y))
         elif can_flow_left:
             # Flow left only
-            left_chunk.blocks[y][left_x] = Block(
-                left_x * BLOCK_SIZE + left_chunk.offset,
-                y * BLOCK_SIZE,
-                WATER,
-                current_distance + 1  # Increment distance from source
-            )
+            left_chunk.set_block(left_x, y, WATER, current_distance + 1)  # Increment distance from source
             updated_blocks.add((left_chunk.position, left_x, y))
         elif can_flow_right:
             # Flow right only
-            right_chunk.blocks[y][right_x] = Block(
-                right_x * BLOCK_SIZE + right_chunk.offset,
-                y * BLOCK_SIZE,
-                WATER,
-                current_distance + 1  # Increment distance from source
-            )
+            right_chunk.set_block(right_x, y, WATER, current_distance + 1)  # Increment distance from source
             updated_blocks.add((right_chunk.position, right_x, y))
 
 
@@ -277,12 +248,7 @@ class WaterSimulation:
             return
 
         # Place water block with distance 0 (source block)
-        chunk.blocks[y][x] = Block(
-            x * BLOCK_SIZE + chunk.offset,
-            y * BLOCK_SIZE,
-            WATER,
-            0  # This is a source block, so distance is 0
-        )
+        chunk.set_block(x, y, WATER, 0)  # This is a source block, so distance is 0
 
     @staticmethod
     def remove_connected_water(chunk: Any, x: int, y: int, chunk_list: List[Any]) -> None:
@@ -313,20 +279,15 @@ class WaterSimulation:
 
             # Skip if not a water block
             if (not (0 <= current_x < CHUNK_WIDTH and 0 <= current_y < CHUNK_HEIGHT) or
-                not isinstance(current_chunk.blocks[current_y][current_x], Block) or
-                current_chunk.blocks[current_y][current_x].block_type != WATER):
+                current_chunk.block_types[current_y][current_x] != WATER):
                 continue
 
             # Skip source blocks (only remove flowing water)
-            if current_chunk.blocks[current_y][current_x].water_distance == 0:
+            if current_chunk.water_distances[current_y][current_x] == 0:
                 continue
 
             # Remove this water block
-            current_chunk.blocks[current_y][current_x] = Block(
-                current_x * BLOCK_SIZE + current_chunk.offset,
-                current_y * BLOCK_SIZE,
-                AIR
-            )
+            current_chunk.set_block(current_x, current_y, AIR)
 
             # Check adjacent blocks
             directions = [(0, -1), (0, 1), (-1, 0), (1, 0)]
@@ -354,6 +315,5 @@ class WaterSimulation:
 
                 # Add to queue if it's a water block
                 if (0 <= next_x < CHUNK_WIDTH and 0 <= next_y < CHUNK_HEIGHT and
-                    isinstance(next_chunk.blocks[next_y][next_x], Block) and
-                    next_chunk.blocks[next_y][next_x].block_type == WATER):
+                    next_chunk.block_types[next_y][next_x] == WATER):
                     queue.append((next_chunk, next_x, next_y))
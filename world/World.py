@@ -4,25 +4,29 @@ World management module for handling chunk loading and unloading.
 This module provides functions for managing the game world, including
 loading and unloading chunks as the player moves through the world.
 """
-from typing import List, Any
+from typing import Any, Deque, Optional
 
 from world.Chunk import Chunk, calculate_player_position
+from world.ChunkCache import ChunkCache
 
 
-def load_chunks(chunk_list: List[Chunk], player: Any) -> None:
+def load_chunks(chunk_list: Deque[Chunk], player: Any, chunk_cache: Optional[ChunkCache] = None) -> None:
     """
     Load and unload chunks based on player position.
 
     This function checks if chunks need to be loaded or unloaded as the player
     moves through the world. It maintains a list of three chunks centered around
-    the player's current position.
+    the player's current position. When a chunk cache is given, unloaded chunks
+    are stored in it, new chunks are taken from it before being generated, and
+    the chunks just beyond either end are prefetched in the background.
 
     Precondition: chunk_list consists of exactly 3 chunks in the world in a
     sequence ordered left to right.
 
     Args:
-        chunk_list: The list of chunks currently loaded in the world.
+        chunk_list: The deque of chunks currently loaded in the world.
         player: The player entity whose position determines chunk loading.
+        chunk_cache: Optional cache of unloaded chunks to reuse instead of regenerating.
     """
     # Get the player's current chunk position
     player_chunk_pos = calculate_player_position(player)
@@ -30,17 +34,28 @@ def load_chunks(chunk_list: List[Chunk], player: Any) -> None:
     # If player is at the left edge of the loaded chunks, load a new chunk to the left
     if chunk_list[0].position == player_chunk_pos:
         # Create a new chunk to the left of the leftmost chunk
-        new_chunk = Chunk(chunk_list[0].position - 1)
-        chunk_list.insert(0, new_chunk)
+        new_position = chunk_list[0].position - 1
+        new_chunk = chunk_cache.get_chunk(new_position) if chunk_cache else Chunk(new_position)
+        chunk_list.appendleft(new_chunk)
 
         # Remove the rightmost chunk to maintain exactly 3 chunks
-        chunk_list.pop()
+        old_chunk = chunk_list.pop()
+        if chunk_cache:
+            chunk_cache.store(old_chunk)
 
     # If player is at the right edge of the loaded chunks, load a new chunk to the right
     if chunk_list[2].position == player_chunk_pos:
         # Create a new chunk to the right of the rightmost chunk
-        new_chunk = Chunk(chunk_list[-1].position + 1)
+        new_position = chunk_list[-1].position + 1
+        new_chunk = chunk_cache.get_chunk(new_position) if chunk_cache else Chunk(new_position)
         chunk_list.append(new_chunk)
 
         # Remove the leftmost chunk to maintain exactly 3 chunks
-        chunk_list.pop(0)
+        old_chunk = chunk_list.popleft()
+        if chunk_cache:
+            chunk_cache.store(old_chunk)
+
+    # Start generating the next chunks in either direction before they are needed
+    if chunk_cache:
+        chunk_cache.prefetch(chunk_list[0].position - 1)
+        chunk_cache.prefetch(chunk_list[-1].position + 1)